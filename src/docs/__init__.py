@@ -1,6 +1,10 @@
-# from .create_doc import create_pdf
-from .create_doc import create_docx
-from .create_doc import visual_info
+__all__ = 'create_docx', 'visual_info'
 
+from src.main.lazy import lazy_attributes
 
-__all__ = 'create_docx', 'visual_info'
+# python-docx and xlsxwriter are imported only when the function is requested
+# 'create_pdf': '.create_doc',
+__getattr__ = lazy_attributes(__name__, {
+    'create_docx': '.create_doc',
+    'visual_info': '.create_doc',
+})
@@ -8,11 +8,12 @@ from typing import (
 )
 
 import src.main.common_funcs as comm_funcs
+import src.main.connection as connection
 
 
 class SelfExamples:
     """ Working with self examples """
-    __slots__ = '_sentences', '_marker', '_db', '_cursor'
+    __slots__ = '_sentences', '_marker', '_connections'
     _TABLE_NAME = 'self_examples'
 
     def __init__(self,
@@ -32,13 +33,13 @@ class SelfExamples:
         if not db_path.exists():
             raise FileExistsError(f"File '{db_path}' not found")
 
+        self._connections = connection.get_manager(db_path)
         try:
-            self._db = sqlite3.connect(db_path)
+            self._connections.connection
         except sqlite3.Error:
             print("Error while connecting to the database")
             raise
 
-        self._cursor = self._db.cursor()
         if self._TABLE_NAME not in comm_funcs.get_table_names(self._cursor):
             raise ValueError("Database doesn't contain the table")
 
@@ -47,6 +48,20 @@ class SelfExamples:
         # function to highlight searched words in examples
         self._marker = marker
 
+    @property
+    def _db(self) -> sqlite3.Connection:
+        """
+        :return: sqlite3.Connection of the current thread.
+        """
+        return self._connections.connection
+
+    @property
+    def _cursor(self) -> sqlite3.Cursor:
+        """
+        :return: sqlite3.Cursor of the current thread.
+        """
+        return self._connections.cursor
+
     def _load(self) -> List[str]:
         """ Get all sentences from the table in the database.
 
@@ -0,0 +1,275 @@
+__all__ = 'AsyncVocabulary', 'AsyncSelfExamples'
+
+import datetime
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, InvalidStateError
+from typing import Dict, Callable, Iterable, Any
+
+import src.examples.examples as examples
+import src.words.words as words
+
+
+class _Background:
+    """ Run the calls of the wrapped object in the executor.
+
+    The methods return concurrent.futures.Future, use
+    asyncio.wrap_future() to await it or add_done_callback()
+    to emit a Qt signal with the result.
+    """
+    __slots__ = '_target', '_executor', '_own_executor', '_searches', '_lock'
+
+    def __init__(self,
+                 target: Any,
+                 executor: ThreadPoolExecutor = None) -> None:
+        """
+        :param target: obj which methods will be called.
+        :param executor: ThreadPoolExecutor to run the calls.
+        By default – new one with one worker thread, so the calls
+        run one by one in the order they have been made.
+        :return: None.
+        """
+        self._target = target
+        self._own_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=type(target).__name__)
+        # name of the search – future of the last search
+        self._searches: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def _call(self,
+              func: Callable,
+              args: tuple,
+              kwargs: Dict[str, Any],
+              mark_running: bool) -> Future:
+        """ Call the function in the executor.
+
+        :param func: callable obj to call.
+        :param args: tuple, positional args of the function.
+        :param kwargs: dict, keyword args of the function.
+        :param mark_running: bool, whether the future is marked as
+        running before the call. Otherwise it can be cancelled while
+        the function runs, then its result is dropped.
+        :return: Future with the result of the function.
+        """
+        future = Future()
+
+        def call() -> None:
+            if mark_running:
+                if not future.set_running_or_notify_cancel():
+                    return
+            elif future.cancelled():
+                return
+            try:
+                result = func(*args, **kwargs)
+            except Exception as error:
+                try:
+                    future.set_exception(error)
+                except InvalidStateError:
+                    pass
+            else:
+                try:
+                    future.set_result(result)
+                except InvalidStateError:
+                    # it has been cancelled while the function ran
+                    pass
+
+        self._executor.submit(call)
+        return future
+
+    def _submit(self,
+                func: Callable,
+                *args: Any,
+                **kwargs: Any) -> Future:
+        """ Call the function in the executor.
+
+        The future is marked as running before the call, so it can
+        be cancelled only while it waits, the writes aren't reported
+        as cancelled while they're being committed.
+
+        :param func: callable obj to call.
+        :param args: positional args of the function.
+        :param kwargs: keyword args of the function.
+        :return: Future with the result of the function.
+        """
+        return self._call(func, args, kwargs, mark_running=True)
+
+    def _search(self,
+                name: str,
+                func: Callable,
+                *args: Any,
+                **kwargs: Any) -> Future:
+        """ Call the search in the executor, the previous
+        search with the same name is cancelled.
+
+        The future isn't marked as running, so the search can be
+        cancelled while it runs, then its result is dropped.
+
+        :param name: str, name of the search.
+        :param func: callable obj, the search.
+        :param args: positional args of the search.
+        :param kwargs: keyword args of the search.
+        :return: Future with the result of the search.
+        """
+        future = self._call(func, args, kwargs, mark_running=False)
+        with self._lock:
+            previous = self._searches.get(name)
+            self._searches[name] = future
+        if previous is not None:
+            previous.cancel()
+        return future
+
+    def shutdown(self,
+                 wait: bool = True) -> None:
+        """ Cancel the searches and stop the executor if it's own one.
+
+        :param wait: bool, whether to wait for the running call.
+        :return: None.
+        """
+        with self._lock:
+            searches, self._searches = self._searches, {}
+        for future in searches.values():
+            future.cancel()
+        if self._own_executor:
+            self._executor.shutdown(wait=wait)
+
+
+class AsyncVocabulary(_Background):
+    """ Vocabulary which works in the background """
+    __slots__ = ()
+
+    def __init__(self,
+                 vocabulary: words.Vocabulary,
+                 executor: ThreadPoolExecutor = None,
+                 indexes: Iterable[str] = ('fuzzy',)) -> None:
+        """
+        :param vocabulary: Vocabulary to work with, it mustn't
+        be used directly while the facade works.
+        :param executor: ThreadPoolExecutor to run the calls.
+        By default – new one with one worker thread.
+        :param indexes: iterable of str, names of the indexes
+        built in the background at once, so the first search
+        doesn't wait for them. By default – the fuzzy one.
+        :return: None.
+        """
+        super().__init__(vocabulary, executor)
+        indexes = tuple(indexes)
+        if indexes:
+            self._submit(vocabulary.build_indexes, *indexes)
+
+    @property
+    def vocabulary(self) -> words.Vocabulary:
+        """
+        :return: Vocabulary, the wrapped one.
+        """
+        return self._target
+
+    def search(self,
+               item: str or words.Word) -> Future:
+        """ Get all similar words, the previous search is cancelled.
+
+        :param item: str or Word, word to find.
+        :return: Future with list of Words.
+        """
+        return self._search('search', self._target.search, item)
+
+    def fuzzy_search(self,
+                     item: str or words.Word,
+                     **kwargs: Any) -> Future:
+        """ Get the closest words to the misspelled item,
+        the previous fuzzy search is cancelled.
+
+        :param item: str or Word, word to find.
+        :param kwargs: max_distance and limit of the search.
+        :return: Future with list of Words.
+        """
+        return self._search(
+            'fuzzy_search', self._target.fuzzy_search, item, **kwargs)
+
+    def search_by_properties(self,
+                             *properties: str) -> Future:
+        """ Find the words with the properties,
+        the previous search is cancelled.
+
+        :param properties: list of str, properties to find.
+        :return: Future with list of Words.
+        """
+        return self._search(
+            'search_by_properties', self._target.search_by_properties,
+            *properties)
+
+    def search_definitions(self,
+                           item: str,
+                           **kwargs: Any) -> Future:
+        """ Find the words by their definitions,
+        the previous search is cancelled.
+
+        :param item: str, words to find.
+        :param kwargs: language and limit of the search.
+        :return: Future with list of Words.
+        """
+        return self._search(
+            'search_definitions', self._target.search_definitions,
+            item, **kwargs)
+
+    def extend(self,
+               items: Iterable[words.Word],
+               **kwargs: Any) -> Future:
+        """ Add the words to the Vocabulary.
+
+        :param items: iterable of Words to add.
+        :param kwargs: chunk_size and on_conflict of the extend.
+        :return: Future with None.
+        """
+        # the caller might change its list while the words are written
+        return self._submit(self._target.extend, list(items), **kwargs)
+
+    def statistics(self) -> Future:
+        """
+        :return: Future with str, statistics of the Vocabulary.
+        """
+        return self._submit(self._target.statistics)
+
+
+class AsyncSelfExamples(_Background):
+    """ SelfExamples which work in the background """
+    __slots__ = ()
+
+    def __init__(self,
+                 self_examples: examples.SelfExamples,
+                 executor: ThreadPoolExecutor = None) -> None:
+        """
+        :param self_examples: SelfExamples to work with, they mustn't
+        be used directly while the facade works.
+        :param executor: ThreadPoolExecutor to run the calls.
+        By default – new one with one worker thread.
+        :return: None.
+        """
+        super().__init__(self_examples, executor)
+
+    @property
+    def self_examples(self) -> examples.SelfExamples:
+        """
+        :return: SelfExamples, the wrapped ones.
+        """
+        return self._target
+
+    def find_examples(self,
+                      word: str) -> Future:
+        """ Find all sentences with the word,
+        the previous search is cancelled.
+
+        :param word: str, word to find its examples.
+        :return: Future with list of str, sentences with the word.
+        """
+        return self._search('find_examples', self._target.find_examples, word)
+
+    def add_sentence(self,
+                     sentence: str,
+                     date: datetime.date = None) -> Future:
+        """ Add a sentence to the database.
+
+        :param sentence: str, sentence to add.
+        :param date: datetime.date of the sentence creating.
+        :return: Future with None.
+        """
+        return self._submit(self._target.add_sentence, sentence, date)
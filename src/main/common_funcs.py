@@ -4,19 +4,18 @@ __all__ = (
     'get_synonyms', 'change_words', 'diff_words_id',
     'dump_json', 'fmt_str', 'is_russian', 'is_english',
     'str_to_date', 'extend_filename', 'american_spelling',
+    'word_ids',
 )
 
-import asyncio
 import datetime
+import functools
 import hashlib
 import json
 import re
 import sqlite3
 from mimetypes import MimeTypes
 from pathlib import Path
-from typing import List, Dict, Callable
-
-import aiohttp
+from typing import List, Dict, Callable, Iterable
 
 import src.main.constants as const
 
@@ -24,6 +23,9 @@ import src.main.constants as const
 SYNONYMS_SEARCH_URL = 'https://rusvectores.org/{model}/{word}/api/json/'
 SYNONYMS_SEARCH_MODEL = 'tayga_upos_skipgram_300_2_2019'
 
+# max amount of the memoized word IDs
+WORD_ID_CACHE_SIZE = 4096
+
 
 def fmt_str(item: str) -> str:
     """ Low and strip the string.
@@ -176,6 +178,8 @@ async def json_from_url_coro(url: str) -> Dict[str, str]:
     :param url: str, URL to get json from there.
     :return: dict, {'search_model': {'word_1': its exact; int, ...}}
     """
+    import aiohttp
+
     async with aiohttp.ClientSession() as sess:
         async with sess.get(url) as resp:
             try:
@@ -197,6 +201,8 @@ def get_synonyms(word: str) -> List[str]:
         raise ValueError(
             f"Str without spaces expected, but '{word}' given")
 
+    import asyncio
+
     url = SYNONYMS_SEARCH_URL.format(
         word=word, model=SYNONYMS_SEARCH_MODEL)
     resp = asyncio.run(json_from_url_coro(url))
@@ -313,7 +319,7 @@ def american_spelling(word: str) -> bool:
     return bool(pattern.search(word))
 
 
-def word_id(item: str) -> str:
+def _word_id(item: str) -> str:
     """ Get word's ID.
 
     ID – first and last 8 symbol from sha3_512 hash.
@@ -329,6 +335,38 @@ def word_id(item: str) -> str:
     return _id[:const.ID_LENGTH // 2] + _id[-const.ID_LENGTH // 2:]
 
 
+@functools.lru_cache(maxsize=WORD_ID_CACHE_SIZE)
+def word_id(item: str) -> str:
+    """ Get word's ID, the last used IDs are memoized.
+
+    ID – first and last 8 symbol from sha3_512 hash.
+
+    :param item: str to get its ID.
+    :return: str, ID.
+    """
+    return _word_id(item)
+
+
+def word_ids(items: Iterable[str]) -> List[str]:
+    """ Get IDs of many words, e.g. while importing.
+
+    Every unique item is hashed once, the memo
+    of word_id() isn't flooded with them.
+
+    :param items: iterable of str to get their IDs.
+    :return: list of str, IDs in the order of the items.
+    """
+    items = list(items)
+    ids = {
+        item: _word_id(item)
+        for item in set(items)
+    }
+    return [
+        ids[item]
+        for item in items
+    ]
+
+
 def get_table_names(cursor: sqlite3.Cursor) -> List[str]:
     """ Get the names of tables in the database.
 
@@ -0,0 +1,162 @@
+__all__ = 'ConnectionManager', 'get_manager'
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Tuple, Callable, Any
+
+
+class ConnectionManager:
+    """ Connections to one SQLite database, every thread gets its own.
+
+    All connections are opened in WAL mode, so the reading
+    threads don't block the writing one and vice versa.
+    """
+    __slots__ = '_db_path', '_local', '_lock', '_connections', '_functions'
+    # pragma – its value, applied to every new connection
+    PRAGMAS = {
+        'journal_mode': 'WAL',
+        # with WAL the database can't be corrupted, only the last
+        # transactions can be lost if the OS crashes
+        'synchronous': 'NORMAL',
+        # bytes of the database file mapped to the memory
+        'mmap_size': 256 * 1024 * 1024,
+        # negative value is KiB of the page cache
+        'cache_size': -16 * 1024,
+        # ms to wait for a lock before 'database is locked'
+        'busy_timeout': 5000,
+        'temp_store': 'MEMORY',
+    }
+    # amount of the prepared statements cached by every connection
+    CACHED_STATEMENTS = 256
+
+    def __init__(self,
+                 db_path: Path) -> None:
+        """
+        :param db_path: Path to the database.
+        :return: None.
+        """
+        self._db_path = db_path
+        # connection and cursor of the current thread
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # all opened connections to close them
+        self._connections: List[sqlite3.Connection] = []
+        # name – amount of the args, function and whether it's deterministic
+        self._functions: Dict[str, Tuple[int, Callable, bool]] = {}
+
+    @property
+    def db_path(self) -> Path:
+        """
+        :return: Path to the database.
+        """
+        return self._db_path
+
+    def _connect(self) -> sqlite3.Connection:
+        """ Open a new connection, apply the pragmas and
+        register the functions.
+
+        :return: sqlite3.Connection, the connection.
+        :exception sqlite3.Error: if something went wrong while connecting.
+        """
+        # the connection is used only by its thread, but
+        # the functions are registered and it's closed by any one
+        connection = sqlite3.connect(
+            self._db_path, check_same_thread=False,
+            cached_statements=self.CACHED_STATEMENTS)
+        try:
+            for pragma, value in self.PRAGMAS.items():
+                connection.execute(f"PRAGMA {pragma} = {value}")
+        except sqlite3.Error:
+            connection.close()
+            raise
+
+        with self._lock:
+            for name, (args, func, deterministic) in self._functions.items():
+                connection.create_function(
+                    name, args, func, deterministic=deterministic)
+            self._connections += [connection]
+        return connection
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """ Get the connection of the current thread, open it if there's no.
+
+        :return: sqlite3.Connection, the connection.
+        :exception sqlite3.Error: if something went wrong while connecting.
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = self._local.connection = self._connect()
+            self._local.cursor = connection.cursor()
+        return connection
+
+    @property
+    def cursor(self) -> sqlite3.Cursor:
+        """
+        :return: sqlite3.Cursor of the connection of the current thread.
+        """
+        # open the connection if there's no
+        self.connection
+        return self._local.cursor
+
+    def execute(self,
+                sql: str,
+                parameters: Any = ()) -> sqlite3.Cursor:
+        """ Execute the statement in the connection of the current thread.
+
+        :param sql: str, the statement.
+        :param parameters: sequence or dict, bound parameters.
+        :return: sqlite3.Cursor with the results.
+        """
+        return self.connection.execute(sql, parameters)
+
+    def create_function(self,
+                        name: str,
+                        args: int,
+                        func: Callable,
+                        deterministic: bool = False) -> None:
+        """ Register SQL function in all connections,
+        the ones opened later get it too.
+
+        :param name: str, name of the function.
+        :param args: int, amount of the args.
+        :param func: callable obj, the function.
+        :param deterministic: bool, whether the function
+        gives the same results for the same args.
+        :return: None.
+        """
+        with self._lock:
+            self._functions[name] = args, func, deterministic
+            for connection in self._connections:
+                connection.create_function(
+                    name, args, func, deterministic=deterministic)
+
+    def close(self) -> None:
+        """ Close all connections.
+
+        :return: None.
+        """
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections = []
+        self._local = threading.local()
+
+
+# resolved path to the database – its manager
+_MANAGERS: Dict[Path, ConnectionManager] = {}
+_MANAGERS_LOCK = threading.Lock()
+
+
+def get_manager(db_path: Path) -> ConnectionManager:
+    """ Get the shared manager of the connections to the database.
+
+    :param db_path: Path to the database.
+    :return: ConnectionManager of the database.
+    """
+    key = Path(db_path).resolve()
+    with _MANAGERS_LOCK:
+        if key not in _MANAGERS:
+            _MANAGERS[key] = ConnectionManager(key)
+        return _MANAGERS[key]
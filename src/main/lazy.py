@@ -0,0 +1,31 @@
+__all__ = 'lazy_attributes',
+
+import importlib
+from typing import Dict, Callable, Any
+
+
+def lazy_attributes(package: str,
+                    attributes: Dict[str, str]) -> Callable[[str], Any]:
+    """ Create the module __getattr__, which imports the module
+    of the requested attribute only when it's requested.
+
+    :param package: str, name of the package, __name__.
+    :param attributes: dict of str, name of the attribute –
+    relative name of the module which defines it.
+    :return: callable obj, __getattr__ of the package.
+    """
+    def __getattr__(name: str) -> Any:
+        """ Import the module of the requested attribute.
+
+        :param name: str, name of the attribute.
+        :return: the attribute.
+        :exception AttributeError: if there's no such attribute.
+        """
+        if name not in attributes:
+            raise AttributeError(
+                f"module '{package}' has no attribute '{name}'")
+
+        module = importlib.import_module(attributes[name], package)
+        return getattr(module, name)
+
+    return __getattr__
@@ -1,4 +1,8 @@
-from .setup import repeat
+__all__ = 'repeat'
 
+from src.main.lazy import lazy_attributes
 
-__all__ = 'repeat'
+# PyQt5 and rnc are imported only when the function is requested
+__getattr__ = lazy_attributes(__name__, {
+    'repeat': '.setup',
+})
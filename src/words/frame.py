@@ -0,0 +1,180 @@
+__all__ = 'VocabularyFrame',
+
+import datetime
+from typing import Dict, Tuple, Iterable, Any
+
+import numpy as np
+
+import src.main.constants as consts
+
+
+class VocabularyFrame:
+    """ Columnar view of the words for analytics.
+
+    Columns:
+        days – int32, ordinal of the date when the word has been learned;
+        ids – fixed-width bytes, words' ids;
+        property codes – int32, codes of the properties of all words
+        one after another;
+        property owners – int32, position of the word
+        which the property code belongs to.
+    """
+    __slots__ = (
+        '_days', '_ids', '_properties',
+        '_property_codes', '_property_owners')
+
+    def __init__(self,
+                 words: Iterable[Any]) -> None:
+        """ Build the columns from the words.
+
+        :param words: iterable of Words.
+        :return: None.
+        """
+        days, ids, codes, owners = [], [], [], []
+        # property – its code
+        properties: Dict[str, int] = {}
+
+        for position, word in enumerate(words):
+            days += [word.date.toordinal()]
+            ids += [word.id]
+            for prop in word.properties:
+                codes += [properties.setdefault(prop, len(properties))]
+                owners += [position]
+
+        self._days = np.array(days, dtype=np.int32)
+        self._ids = np.array(ids, dtype=f"S{consts.ID_LENGTH}")
+        self._properties = properties
+        self._property_codes = np.array(codes, dtype=np.int32)
+        self._property_owners = np.array(owners, dtype=np.int32)
+
+    @property
+    def days(self) -> np.ndarray:
+        """
+        :return: np.ndarray of int32, ordinals of the dates.
+        """
+        return self._days
+
+    @property
+    def ids(self) -> np.ndarray:
+        """
+        :return: np.ndarray of bytes, words' ids.
+        """
+        return self._ids
+
+    def _days_count(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        :return: tuple of np.ndarray, sorted unique ordinals of
+        the dates and amount of the words learned on them.
+        """
+        return np.unique(self._days, return_counts=True)
+
+    def dynamic(self) -> Dict[datetime.date, int]:
+        """
+        :return: dict of datetime.date and int, pairs:
+        date – amount of learned words in this date, sorted by dates.
+        """
+        days, counts = self._days_count()
+        return {
+            datetime.date.fromordinal(int(day)): int(count)
+            for day, count in zip(days, counts)
+        }
+
+    def duration(self) -> int:
+        """
+        :return: int, amount of days from the first date to the last one.
+        """
+        return int(self._days.max() - self._days.min()) + 1
+
+    def empty_days_count(self) -> int:
+        """
+        :return: int, amount of days, the user did nothing.
+        """
+        return self.duration() - len(np.unique(self._days))
+
+    def avg_count_of_words(self) -> int:
+        """
+        :return: int, average amount of words learned per one day.
+        """
+        return len(self) // len(np.unique(self._days))
+
+    def max_day_info(self) -> Tuple[datetime.date, int]:
+        """ Get info about the day with max words count.
+
+        :return: tuple of datetime.date and int.
+        """
+        days, counts = self._days_count()
+        index = counts.argmax()
+        return datetime.date.fromordinal(int(days[index])), int(counts[index])
+
+    def min_day_info(self) -> Tuple[datetime.date, int]:
+        """ Get info about the day with min words count.
+
+        :return: tuple of datetime.date and int.
+        """
+        days, counts = self._days_count()
+        index = counts.argmin()
+        return datetime.date.fromordinal(int(days[index])), int(counts[index])
+
+    def between(self,
+                start: datetime.date = None,
+                stop: datetime.date = None) -> np.ndarray:
+        """ Get the words learned between the dates: [start; stop].
+
+        :param start: datetime.date, the first date.
+        By default – from the first date.
+        :param stop: datetime.date, the last date.
+        By default – up to the last date.
+        :return: np.ndarray of int, sorted positions of the found words.
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if start is not None:
+            mask &= self._days >= start.toordinal()
+        if stop is not None:
+            mask &= self._days <= stop.toordinal()
+        return np.flatnonzero(mask)
+
+    def with_properties(self,
+                        *properties: str) -> np.ndarray:
+        """ Find the words with all the properties.
+
+        :param properties: list of str, formatted properties.
+        :return: np.ndarray of int, sorted positions of the found words.
+        """
+        mask = np.ones(len(self), dtype=bool)
+        for prop in properties:
+            if prop not in self._properties:
+                return np.array([], dtype=np.int64)
+
+            code = self._properties[prop]
+            has_property = np.zeros(len(self), dtype=bool)
+            has_property[self._property_owners[
+                self._property_codes == code]] = True
+            mask &= has_property
+        return np.flatnonzero(mask)
+
+    def properties_count(self) -> Dict[str, int]:
+        """
+        :return: dict of str and int, property – amount of
+        the words with it, sorted by the properties.
+        """
+        counts = np.bincount(
+            self._property_codes, minlength=len(self._properties))
+        return {
+            prop: int(counts[self._properties[prop]])
+            for prop in sorted(self._properties)
+        }
+
+    def with_ids(self,
+                 *ids: str) -> np.ndarray:
+        """
+        :param ids: list of str, ids to find.
+        :return: np.ndarray of int, sorted positions of the words.
+        """
+        ids = np.array(ids, dtype=f"S{consts.ID_LENGTH}")
+        return np.flatnonzero(np.isin(self._ids, ids))
+
+    def __len__(self) -> int:
+        """
+        :return: int, amount of the words.
+        """
+        return len(self._days)
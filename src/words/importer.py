@@ -0,0 +1,127 @@
+__all__ = 'import_cambridge_tables',
+
+import datetime
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Dict, Tuple
+
+import src.main.constants as consts
+import src.words.words as words
+
+
+def _parse_file(f_name: Path,
+                date: datetime.date = None) -> List[words.Word]:
+    """ Parse xlsx file from Cambridge Dictionary in a worker process.
+
+    :param f_name: Path, name of xlsx file.
+    :param date: datetime.date, words have been learned on this date.
+    By default – the date of the file modification.
+    :return: list of Words.
+    """
+    date = date or datetime.date.fromtimestamp(f_name.stat().st_mtime)
+    return list(words.parse_cambridge_xlsx(f_name, date))
+
+
+def _table_files(folder: Path) -> List[Path]:
+    """ Get xlsx files exported from Cambridge Dictionary.
+
+    Files with the dynamic of learning and
+    lock files of the opened tables are skipped.
+
+    :param folder: Path to the folder with the files.
+    :return: list of Path, sorted files.
+    """
+    return sorted(
+        path
+        for path in folder.glob('*.xlsx')
+        if not path.name.startswith(('info_', '~$'))
+    )
+
+
+def _merge(parsed: List[List[words.Word]]) -> List[words.Word]:
+    """ Join the same words from the different files to one Word.
+
+    The words are the same if their words and properties are equal,
+    the repeated definitions are skipped.
+
+    :param parsed: list of lists of Words, words from every file.
+    :return: list of Words, merged ones.
+    """
+    # (word, properties) – id, date, English and Russian defs
+    merged: Dict[Tuple[str, Tuple[str, ...]],
+                 Tuple[str, datetime.date, Dict, Dict]] = {}
+    for file_words in parsed:
+        for word in file_words:
+            key = word.word, tuple(word.properties)
+            word_id, date, english, russian = merged.get(
+                key, (word.id, word.date, {}, {}))
+            # dicts keep the order of the definitions
+            english.update(dict.fromkeys(word.english))
+            russian.update(dict.fromkeys(word.russian))
+            merged[key] = word_id, min(date, word.date), english, russian
+
+    # the ids have been counted by the parser, they aren't counted again
+    return [
+        words.Word(word, date, list(properties),
+                   list(english), list(russian), word_id)
+        for (word, properties), (word_id, date, english, russian)
+        in merged.items()
+    ]
+
+
+def import_cambridge_tables(vocabulary: words.Vocabulary,
+                            folder: Path = consts.TABLE_FOLDER,
+                            workers: int = None,
+                            date: datetime.date = None) -> Dict[str, float]:
+    """ Import all xlsx files from Cambridge Dictionary in the folder.
+
+    Stages:
+        parse – files are parsed in a process pool;
+        merge – the same words from the different files are joined;
+        dedup – the words which ids are in the Vocabulary are skipped;
+        write – the rest words are written in one transaction,
+        the words with equal ids are merged.
+
+    :param vocabulary: Vocabulary to add the words.
+    :param folder: Path to the folder with the files.
+    :param workers: int, amount of the worker processes.
+    By default – amount of CPUs.
+    :param date: datetime.date, words have been learned on this date.
+    By default – the date of the file modification.
+    :return: dict of str and float, stage – its duration in seconds
+    and 'total' – duration of the whole import.
+    :exception FileNotFoundError: if the folder doesn't exist.
+    """
+    if not folder.exists():
+        raise FileNotFoundError(f"Folder '{folder}' doesn't exist")
+
+    timings = {}
+    start = stage_start = time.perf_counter()
+
+    files = _table_files(folder)
+    if len(files) > 1 and workers != 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parsed = list(executor.map(_parse_file, files, [date] * len(files)))
+    else:
+        parsed = [_parse_file(f_name, date) for f_name in files]
+    timings['parse'] = time.perf_counter() - stage_start
+
+    stage_start = time.perf_counter()
+    merged = _merge(parsed)
+    timings['merge'] = time.perf_counter() - stage_start
+
+    stage_start = time.perf_counter()
+    new_words = [
+        word
+        for word in merged
+        if not vocabulary.has_id(word.id)
+    ]
+    timings['dedup'] = time.perf_counter() - stage_start
+
+    stage_start = time.perf_counter()
+    vocabulary.extend(new_words)
+    timings['write'] = time.perf_counter() - stage_start
+
+    timings['total'] = time.perf_counter() - start
+    return timings
@@ -0,0 +1,703 @@
+__all__ = (
+    'IdIndex', 'NgramIndex', 'PropertyIndex', 'DateIndex',
+    'SortedIndex', 'FuzzyIndex'
+)
+
+import array
+import bisect
+import datetime
+import sys
+from typing import List, Dict, Any, Set, Tuple, Iterator, Iterable
+
+
+class IdIndex:
+    """ Index: word's id – positions of the words in the data list """
+    __slots__ = '_positions',
+
+    def __init__(self) -> None:
+        self._positions: Dict[str, List[int]] = {}
+
+    def add(self,
+            position: int,
+            word: Any) -> None:
+        """ Add the word to the index.
+
+        :param position: int, position of the word in the data list.
+        :param word: Word to add.
+        :return: None.
+        """
+        bisect.insort(self._positions.setdefault(word.id, []), position)
+
+    def discard(self,
+                position: int,
+                word: Any) -> None:
+        """ Remove the word from the index if it's there.
+
+        :param position: int, position of the word in the data list.
+        :param word: Word to remove.
+        :return: None.
+        """
+        positions = self._positions.get(word.id, [])
+        if position in positions:
+            positions.remove(position)
+        if not positions:
+            self._positions.pop(word.id, None)
+
+    def get(self,
+            word_id: str) -> List[int]:
+        """
+        :param word_id: str, id to find.
+        :return: list of int, positions of the words with the id.
+        """
+        return self._positions.get(word_id, [])
+
+    def __contains__(self,
+                     word_id: str) -> bool:
+        """
+        :param word_id: str, id to check.
+        :return: bool, whether there's a word with the id.
+        """
+        return word_id in self._positions
+
+    def __iter__(self) -> iter:
+        """
+        :return: iter to the ids.
+        """
+        return iter(self._positions)
+
+    def __len__(self) -> int:
+        """
+        :return: int, amount of the unique ids.
+        """
+        return len(self._positions)
+
+
+class NgramIndex:
+    """ Substring index over the words: n-gram – positions
+    of the words which contain it, the positions are sorted.
+    """
+    __slots__ = '_postings', '_words', '_strings'
+    # lengths of the indexed n-grams
+    _SIZES = 2, 3
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, List[int]] = {}
+        # word – positions of the words
+        self._words: Dict[str, List[int]] = {}
+        # position – word
+        self._strings: Dict[int, str] = {}
+
+    @classmethod
+    def _grams(cls,
+               item: str) -> Set[str]:
+        """
+        :param item: str to split.
+        :return: set of str, all n-grams of the item.
+        """
+        return {
+            item[start:start + size]
+            for size in cls._SIZES
+            for start in range(len(item) - size + 1)
+        }
+
+    def add(self,
+            position: int,
+            word: Any) -> None:
+        """ Add the word to the index.
+
+        :param position: int, position of the word in the data list.
+        :param word: Word to add.
+        :return: None.
+        """
+        item = word.word
+        self._strings[position] = item
+        bisect.insort(self._words.setdefault(item, []), position)
+        for gram in self._grams(item):
+            bisect.insort(self._postings.setdefault(gram, []), position)
+
+    def discard(self,
+                position: int,
+                word: Any) -> None:
+        """ Remove the word from the index if it's there.
+
+        :param position: int, position of the word in the data list.
+        :param word: Word to remove.
+        :return: None.
+        """
+        item = self._strings.pop(position, None)
+        if item is None:
+            return
+
+        for key, index in [(item, self._words)] + [
+                (gram, self._postings) for gram in self._grams(item)]:
+            positions = index[key]
+            del positions[bisect.bisect_left(positions, position)]
+            if not positions:
+                del index[key]
+
+    def search(self,
+               item: str) -> List[int]:
+        """ Find the words which contain the item
+        or which are contained in the item.
+
+        :param item: str, formatted item to find.
+        :return: list of int, sorted positions of the found words.
+        """
+        if len(item) < min(self._SIZES):
+            # almost all words contain so short item
+            candidates = self._strings
+        elif len(item) <= max(self._SIZES):
+            candidates = self._postings.get(item, [])
+        else:
+            # check the words from the rarest n-gram of the item
+            candidates = min(
+                (self._postings.get(gram, []) for gram in self._grams(item)),
+                key=len
+            )
+        found = {
+            position
+            for position in candidates
+            if item in self._strings[position]
+        }
+
+        substrings = {
+            item[start:stop]
+            for start in range(len(item) + 1)
+            for stop in range(start, len(item) + 1)
+        }
+        for substring in substrings:
+            found.update(self._words.get(substring, []))
+
+        return sorted(found)
+
+
+class PropertyIndex:
+    """ Inverted index: property – bitset of the positions
+    of the words with the property.
+
+    Bitset is int, n-th bit is set if the word
+    at n-th position has the property.
+    """
+    __slots__ = '_bitsets',
+
+    def __init__(self) -> None:
+        self._bitsets: Dict[str, int] = {}
+
+    @staticmethod
+    def _positions(bitset: int) -> List[int]:
+        """
+        :param bitset: int, bitset to convert.
+        :return: list of int, sorted positions of the set bits.
+        """
+        # the lowest bit goes first
+        bits = bin(bitset)[:1:-1]
+        positions, position = [], bits.find('1')
+        while position != -1:
+            positions += [position]
+            position = bits.find('1', position + 1)
+        return positions
+
+    @staticmethod
+    def _bit_count(bitset: int) -> int:
+        """ int.bit_count() is only in Python 3.10+.
+
+        :param bitset: int, bitset to count.
+        :return: int, amount of the set bits.
+        """
+        return bin(bitset).count('1')
+
+    def _intersection(self,
+                      *properties: str) -> int:
+        """
+        :param properties: list of str, formatted properties.
+        :return: int, bitset of the words with all the properties.
+        """
+        bitsets = sorted(
+            (self._bitsets.get(prop, 0) for prop in properties),
+            key=self._bit_count
+        )
+        result = bitsets[0]
+        for bitset in bitsets[1:]:
+            if not result:
+                break
+            result &= bitset
+        return result
+
+    def add(self,
+            position: int,
+            word: Any) -> None:
+        """ Add the word to the index.
+
+        :param position: int, position of the word in the data list.
+        :param word: Word to add.
+        :return: None.
+        """
+        bit = 1 << position
+        for prop in word.properties:
+            prop = sys.intern(prop)
+            self._bitsets[prop] = self._bitsets.get(prop, 0) | bit
+
+    def discard(self,
+                position: int,
+                word: Any) -> None:
+        """ Remove the word from the index if it's there.
+
+        :param position: int, position of the word in the data list.
+        :param word: Word to remove.
+        :return: None.
+        """
+        bit = 1 << position
+        for prop in word.properties:
+            bitset = self._bitsets.get(prop, 0) & ~bit
+            if bitset:
+                self._bitsets[prop] = bitset
+            else:
+                self._bitsets.pop(prop, None)
+
+    def search(self,
+               *properties: str) -> List[int]:
+        """ Find the words with all the properties.
+
+        :param properties: list of str, formatted properties.
+        :return: list of int, sorted positions of the found words.
+        """
+        return self._positions(self._intersection(*properties))
+
+    def count(self,
+              *properties: str) -> int:
+        """
+        :param properties: list of str, formatted properties.
+        :return: int, amount of the words with all the properties.
+        """
+        return self._bit_count(self._intersection(*properties))
+
+    def counts(self) -> Dict[str, int]:
+        """
+        :return: dict of str and int, property – amount
+        of the words with it, sorted by the properties.
+        """
+        return {
+            prop: self._bit_count(self._bitsets[prop])
+            for prop in sorted(self._bitsets)
+        }
+
+
+class DateIndex:
+    """ Index: sorted list of the dates and date – sorted
+    positions of the words learned on the date.
+    """
+    __slots__ = '_dates', '_buckets'
+
+    def __init__(self) -> None:
+        self._dates: List[datetime.date] = []
+        self._buckets: Dict[datetime.date, List[int]] = {}
+
+    @property
+    def dates(self) -> List[datetime.date]:
+        """
+        :return: list of datetime.date, sorted dates
+        when something has been learned.
+        """
+        return self._dates
+
+    def add(self,
+            position: int,
+            word: Any) -> None:
+        """ Add the word to the index.
+
+        :param position: int, position of the word in the data list.
+        :param word: Word to add.
+        :return: None.
+        """
+        if word.date not in self._buckets:
+            bisect.insort(self._dates, word.date)
+        bisect.insort(self._buckets.setdefault(word.date, []), position)
+
+    def discard(self,
+                position: int,
+                word: Any) -> None:
+        """ Remove the word from the index if it's there.
+
+        :param position: int, position of the word in the data list.
+        :param word: Word to remove.
+        :return: None.
+        """
+        positions = self._buckets.get(word.date, [])
+        index = bisect.bisect_left(positions, position)
+        if positions[index:index + 1] == [position]:
+            del positions[index]
+        if not positions and word.date in self._buckets:
+            del self._buckets[word.date]
+            del self._dates[bisect.bisect_left(self._dates, word.date)]
+
+    def at(self,
+           date: datetime.date) -> List[int]:
+        """
+        :param date: datetime.date, date to find.
+        :return: list of int, sorted positions of the
+        words learned on the date.
+        """
+        return self._buckets.get(date, [])
+
+    def between(self,
+                start: datetime.date = None,
+                stop: datetime.date = None) -> List[int]:
+        """ Get the words learned between the dates: [start; stop].
+
+        :param start: datetime.date, the first date.
+        By default – from the first date.
+        :param stop: datetime.date, the last date.
+        By default – up to the last date.
+        :return: list of int, sorted positions of the found words.
+        """
+        first = 0 if start is None else bisect.bisect_left(self._dates, start)
+        last = (len(self._dates) if stop is None
+                else bisect.bisect_right(self._dates, stop))
+
+        positions = [
+            position
+            for date in self._dates[first:last]
+            for position in self._buckets[date]
+        ]
+        # the buckets are sorted, usually they follow one by one
+        positions.sort()
+        return positions
+
+    def __len__(self) -> int:
+        """
+        :return: int, amount of the dates.
+        """
+        return len(self._dates)
+
+
+class SortedIndex:
+    """ Alphabetically sorted list of pairs: word – its position.
+
+    The equal words are sorted by their positions, it's
+    the same order as the stable sort of the data list gives.
+    """
+    __slots__ = '_items',
+
+    def __init__(self) -> None:
+        self._items: List[Tuple[str, int]] = []
+
+    def build(self,
+              words: Iterable[Any]) -> None:
+        """ Fill the index by the data list at once,
+        one sort instead of insertion of every word.
+
+        :param words: iterable of Words, the data list.
+        :return: None.
+        """
+        self._items = sorted(
+            (word.word, position)
+            for position, word in enumerate(words)
+        )
+
+    def add(self,
+            position: int,
+            word: Any) -> None:
+        """ Add the word to the index.
+
+        :param position: int, position of the word in the data list.
+        :param word: Word to add.
+        :return: None.
+        """
+        bisect.insort(self._items, (word.word, position))
+
+    def discard(self,
+                position: int,
+                word: Any) -> None:
+        """ Remove the word from the index if it's there.
+
+        :param position: int, position of the word in the data list.
+        :param word: Word to remove.
+        :return: None.
+        """
+        item = word.word, position
+        index = bisect.bisect_left(self._items, item)
+        if self._items[index:index + 1] == [item]:
+            del self._items[index]
+
+    def positions(self,
+                  reverse: bool = False) -> Iterator[int]:
+        """ Iterate over the positions of the sorted words.
+
+        :param reverse: bool, whether the words will be in reversed
+        order. The equal words keep their order like with the stable sort.
+        :return: iter to int, positions of the words.
+        """
+        if not reverse:
+            for _, position in self._items:
+                yield position
+            return
+
+        # positions of the equal words
+        run, run_word = [], None
+        for word, position in reversed(self._items):
+            if word != run_word:
+                yield from reversed(run)
+                run, run_word = [], word
+            run += [position]
+        yield from reversed(run)
+
+    def __len__(self) -> int:
+        """
+        :return: int, amount of the words.
+        """
+        return len(self._items)
+
+
+
+class FuzzyIndex:
+    """ Symmetric delete index for the typo-tolerant search.
+
+    The index keeps all strings which can be got from the
+    prefixes of the words by deletion of up to MAX_DISTANCE
+    symbols. If the word is within the edit distance from the item,
+    the item and the word have a common deletion, so the candidates
+    are only the words of the deletions of the item.
+
+    The deletions aren't stored: every one is kept as an int
+    key in the sorted array, the hash of the deletion in the high
+    bits and the code of the word in the low ones. The collisions
+    of the hashes only add candidates, they're checked by distance.
+    """
+    __slots__ = '_words', '_codes', '_positions', '_keys', '_recent'
+    # max edit distance of the search
+    MAX_DISTANCE = 2
+    # only the beginnings of the words are used for the deletions
+    PREFIX_LENGTH = 7
+    # low bits of the key for the code of the word, up to 16M words
+    CODE_BITS = 24
+    _CODE_MASK = (1 << CODE_BITS) - 1
+    _HASH_MASK = (1 << 64 - CODE_BITS) - 1
+    # min amount of the hashes added after the build to merge them
+    MERGE_SIZE = 4096
+
+    def __init__(self) -> None:
+        # code – word, positions of the word
+        self._words: List[str] = []
+        self._positions: List[List[int]] = []
+        # word – its code
+        self._codes: Dict[str, int] = {}
+        # sorted keys: hash of the deletion – code of the word
+        self._keys = array.array('Q')
+        # hash of the deletion – codes of the words added after the build
+        self._recent: Dict[int, List[int]] = {}
+
+    @classmethod
+    def _deletions(cls,
+                   item: str,
+                   max_distance: int) -> Set[str]:
+        """
+        :param item: str to delete the symbols from.
+        :param max_distance: int, max amount of the deleted symbols.
+        :return: set of str, the prefix of the item and all strings
+        which can be got from it by deletion of the symbols.
+        """
+        deletions = level = {item[:cls.PREFIX_LENGTH]}
+        for _ in range(max_distance):
+            level = {
+                item[:index] + item[index + 1:]
+                for item in level
+                for index in range(len(item))
+            }
+            deletions |= level
+        return deletions
+
+    @staticmethod
+    def distance(first: str,
+                 second: str,
+                 limit: int) -> int:
+        """ Levenshtein distance: the least amount of
+        insertions, deletions and substitutions of
+        the symbols to get the second str from the first one.
+
+        :param first: str to compare.
+        :param second: str to compare.
+        :param limit: int, max interesting distance.
+        :return: int, the distance or limit + 1 if it's greater.
+        """
+        if len(first) < len(second):
+            first, second = second, first
+        if len(first) - len(second) > limit:
+            return limit + 1
+
+        previous = list(range(len(second) + 1))
+        for row, symbol in enumerate(first, 1):
+            current = [row]
+            for column, other in enumerate(second):
+                current += [min(previous[column + 1] + 1,
+                                current[column] + 1,
+                                previous[column] + (symbol != other))]
+            if min(current) > limit:
+                return limit + 1
+            previous = current
+        return min(previous[-1], limit + 1)
+
+    @classmethod
+    def _hash(cls,
+              deletion: str) -> int:
+        """
+        :param deletion: str, the deletion.
+        :return: int, hash of the deletion, which fits the key.
+        """
+        return hash(deletion) & cls._HASH_MASK
+
+    def _code(self,
+              item: str) -> int:
+        """ Get the code of the word, give the new one if there's no.
+
+        :param item: str, the word.
+        :return: int, code of the word.
+        """
+        code = self._codes.get(item)
+        if code is None:
+            code = self._codes[item] = len(self._words)
+            self._words += [item]
+            self._positions += [[]]
+        return code
+
+    def _sort_keys(self,
+                   keys: Iterable[int]) -> None:
+        """ Put the keys with the ones of the index to the sorted array.
+
+        The keys are split by their high bits to the buckets,
+        only one bucket at a time is sorted as list of ints.
+
+        :param keys: iterable of int, keys to add.
+        :return: None.
+        """
+        shift = 64 - 8
+        buckets = [array.array('Q') for _ in range(1 << 8)]
+        appends = [bucket.append for bucket in buckets]
+        for key in keys:
+            appends[key >> shift](key)
+        for key in self._keys:
+            appends[key >> shift](key)
+
+        self._keys = array.array('Q')
+        for bucket in buckets:
+            self._keys.extend(sorted(bucket))
+
+    def build(self,
+              words: Iterable[Any]) -> None:
+        """ Fill the index by the data list at once.
+
+        :param words: iterable of Words, the data list.
+        :return: None.
+        """
+        first_code = len(self._words)
+        for position, word in enumerate(words):
+            self._positions[self._code(word.word)].append(position)
+
+        # the hash is inlined, it's counted for every deletion
+        mask, bits = self._HASH_MASK, self.CODE_BITS
+        self._sort_keys(
+            (hash(deletion) & mask) << bits | code
+            for code in range(first_code, len(self._words))
+            for deletion in self._deletions(self._words[code], self.MAX_DISTANCE)
+        )
+
+    def add(self,
+            position: int,
+            word: Any) -> None:
+        """ Add the word to the index.
+
+        The deletions of the new words are kept in the dict
+        until there are enough of them to merge to the array.
+
+        :param position: int, position of the word in the data list.
+        :param word: Word to add.
+        :return: None.
+        """
+        item = word.word
+        if item in self._codes:
+            bisect.insort(self._positions[self._codes[item]], position)
+            return
+
+        code = self._code(item)
+        self._positions[code] += [position]
+        for deletion in self._deletions(item, self.MAX_DISTANCE):
+            self._recent.setdefault(self._hash(deletion), []).append(code)
+
+        if len(self._recent) > max(self.MERGE_SIZE, len(self._keys) // 8):
+            recent, self._recent = self._recent, {}
+            self._sort_keys(
+                deletion_hash << self.CODE_BITS | code
+                for deletion_hash, codes in recent.items()
+                for code in codes
+            )
+
+    def discard(self,
+                position: int,
+                word: Any) -> None:
+        """ Remove the word from the index if it's there.
+
+        The deletions of the word stay, the words
+        without positions aren't found.
+
+        :param position: int, position of the word in the data list.
+        :param word: Word to remove.
+        :return: None.
+        """
+        code = self._codes.get(word.word)
+        positions = [] if code is None else self._positions[code]
+        index = bisect.bisect_left(positions, position)
+        if positions[index:index + 1] == [position]:
+            del positions[index]
+
+    def _candidates(self,
+                    deletion: str) -> Iterator[int]:
+        """
+        :param deletion: str, the deletion.
+        :return: iter to int, codes of the words
+        which might have the deletion.
+        """
+        deletion_hash = self._hash(deletion)
+        start = bisect.bisect_left(self._keys, deletion_hash << self.CODE_BITS)
+        stop = bisect.bisect_left(
+            self._keys, deletion_hash + 1 << self.CODE_BITS, start)
+        for key in self._keys[start:stop]:
+            yield key & self._CODE_MASK
+        yield from self._recent.get(deletion_hash, [])
+
+    def search(self,
+               item: str,
+               max_distance: int,
+               limit: int) -> List[Tuple[int, str, List[int]]]:
+        """ Find the closest words to the item.
+
+        :param item: str, formatted item to find.
+        :param max_distance: int, max edit distance to the words,
+        not greater than MAX_DISTANCE.
+        :param limit: int, max amount of the found words.
+        :return: list of tuples: distance, word and its positions,
+        sorted by the distance and by the word.
+        :exception ValueError: if the max distance is wrong.
+        """
+        if not 0 <= max_distance <= self.MAX_DISTANCE:
+            raise ValueError(f"Max distance must be in [0; {self.MAX_DISTANCE}], "
+                             f"but {max_distance} given")
+
+        candidates = {
+            code
+            for deletion in self._deletions(item, max_distance)
+            for code in self._candidates(deletion)
+        }
+        found = []
+        for code in candidates:
+            word, positions = self._words[code], self._positions[code]
+            distance = self.distance(item, word, max_distance)
+            if distance <= max_distance and positions:
+                found += [(distance, word, list(positions))]
+
+        found.sort()
+        return found[:max(limit, 0)]
+
+    def __len__(self) -> int:
+        """
+        :return: int, amount of the unique words.
+        """
+        return len(self._codes)
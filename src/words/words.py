@@ -1,96 +1,136 @@
+import array
 import datetime
-import functools
+import hashlib
 import itertools
+import json
+import mmap
+import operator
 import os
+import re
 import sqlite3
-from collections import Counter
+import struct
+import sys
+from collections import Counter, OrderedDict
+from collections.abc import Sequence
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Set, Iterator, Iterable
 
-import xlrd
-
-import src.docs.create_doc as create_doc
 import src.main.common_funcs as comm_funcs
+import src.main.connection as connection
 import src.main.constants as consts
+import src.words.indexes as indexes
 
 
 def parse_cambridge_xlsx(f_name: Path,
-                         date: datetime.date = None) -> List[Any]:
-    """ Parse xlsx file from Cambridge Dictionary to list of words.
+                         date: datetime.date = None) -> Iterator[Any]:
+    """ Parse xlsx file from Cambridge Dictionary to Words.
+
+    There are words with one definition. Join the definitions
+    of the same words with the same properties to one Word.
 
-    There are words with one definition. Group the similar words
-    with the different definitions to Word.
+    Rows are read one by one, every Word is created once
+    when all its definitions are collected.
 
     :param f_name: Path, name of xlsx file.
     :param date: datetime.date, words have been learned on this date.
-    :return: list of Words.
+    :return: iter to Words in order of their first rows.
+    :exception FileExistsError: if the file doesn't exist.
     """
     if not f_name.exists():
         raise FileExistsError("File doesn't exist")
 
-    date = date or datetime.datetime.today()
-
-    rb = xlrd.open_workbook(str(f_name))
-    sheet = rb.sheet_by_index(0)
-    row_values = [
-        sheet.row_values(row)
-        for row in range(sheet.nrows)
-    ]
-    # remove empty row ([0]), header, description etc ([1])
-    row_values = row_values[2:]
-    row_values.sort(key=lambda x: x[0])
-    content = [
-        Word(word=field[0], date=date, properties=field[1],
-             english=field[2], russian=field[3])
-        for field in row_values
-    ]
-    # group the same words
-    content = itertools.groupby(
-        content, key=lambda word: (word.word, word.properties))
-
-    words = []
-    for group in content:
-        # sum the same words to one
-        words += [
-            functools.reduce(
-                lambda res, word_with_one_def: res + word_with_one_def,
-                list(group[1]),
-                Word(''))
-        ]
-    return words
+    return _parse_cambridge_rows(f_name, date or datetime.date.today())
+
+
+def _parse_cambridge_rows(f_name: Path,
+                          date: datetime.date) -> Iterator[Any]:
+    """ Read the rows of xlsx file from Cambridge Dictionary,
+    group the definitions of the same words.
+
+    :param f_name: Path, name of xlsx file.
+    :param date: datetime.date, words have been learned on this date.
+    :return: iter to Words.
+    """
+    import xlrd
+
+    rb = xlrd.open_workbook(str(f_name), on_demand=True)
+    # (word, properties) – English and Russian defs
+    words: Dict[Tuple[str, Tuple[str, ...]], Tuple[List, List]] = {}
+    # the workbook is released even if a row is malformed
+    try:
+        sheet = rb.sheet_by_index(0)
+        # skip empty row ([0]), header, description etc ([1])
+        for row in itertools.islice(sheet.get_rows(), 2, None):
+            word, properties, english, russian = (
+                cell.value for cell in row[:4])
+            key = comm_funcs.fmt_str(word), Word.fmt_properties(properties)
+
+            english_defs, russian_defs = words.setdefault(key, ([], []))
+            if english:
+                english_defs += [english]
+            if russian:
+                russian_defs += [russian]
+    finally:
+        rb.release_resources()
+
+    # all ids are counted at once bypassing the memo of word_id()
+    ids = comm_funcs.word_ids(word for word, _ in words)
+    for ((word, properties), (english, russian)), word_id in zip(
+            words.items(), ids):
+        yield Word(word, date, list(properties), english, russian, word_id)
 
 
 class Word:
     __slots__ = (
         '_word', '_id', '_properties',
         '_english_defs', '_russian_defs', '_date')
+    # key to sort the words by alphabet
+    sort_key = operator.attrgetter('_word')
+    # definitions are kept in one str joined with this separator
+    _DEFS_SEP = '\x1f'
+    # joined properties – shared tuple of the interned properties
+    _PROPERTIES: Dict[str, Tuple[str, ...]] = {}
+    # ISO date – shared date obj
+    _DATES: Dict[str, datetime.date] = {}
 
     def __init__(self,
                  word: str = '',
                  date: datetime.date or str = None,
                  properties: List[str] or str = None,
                  english: str or List[str] = None,
-                 russian: str or List[str] = None) -> None:
+                 russian: str or List[str] = None,
+                 word_id: str = None) -> None:
         """
         :param word: str, word. It will be lowered and stripped.
         :param properties: str or list of str, language level, formal, ancient etc.
         :param date: datetime.date, in this date the word has been learned.
         :param english: str or list of str, English definitions of the word.
         :param russian: str or list of str, Russian definitions of the word.
+        :param word_id: str, id of the formatted word, if it's known,
+        e.g. got by word_ids() while importing. By default – it's counted.
         """
         self._word = comm_funcs.fmt_str(word)
-        self._id = comm_funcs.word_id(self._word)
+        self._id = word_id or comm_funcs.word_id(self._word)
 
-        english = english or []
-        russian = russian or []
-        self._english_defs = (
-            english.split('; ') if isinstance(english, str) else english)
-        self._russian_defs = (
-            russian.split('; ') if isinstance(russian, str) else russian)
+        self._english_defs = self._join_defs(english or [])
+        self._russian_defs = self._join_defs(russian or [])
 
-        date = date or datetime.datetime.today()
+        date = date or datetime.date.today()
+        if isinstance(date, datetime.datetime):
+            # the database keeps dates only
+            date = date.date()
         self._date = comm_funcs.str_to_date(date)
 
+        self._properties = self.fmt_properties(properties)
+
+    @classmethod
+    def fmt_properties(cls,
+                       properties: List[str] or str = None) -> Tuple[str, ...]:
+        """ Format, sort and remove duplicates of the properties.
+
+        :param properties: str or list of str, properties.
+        :return: tuple of str, shared tuple of the formatted properties.
+        """
         properties = properties or list()
         if isinstance(properties, str):
             if properties.startswith('[') and properties.endswith(']'):
@@ -104,7 +144,110 @@ class Word:
         ]
         properties = list(Counter(properties).keys())
         properties.sort()
+        return cls._intern_properties(properties)
+
+    @classmethod
+    def _join_defs(cls,
+                   defs: str or List[str]) -> str:
+        """ Convert the definitions to the compact storage format.
+
+        :param defs: str joined with '; ' or list of str, definitions.
+        :return: str, definitions joined with the separator.
+        """
+        if isinstance(defs, str):
+            return defs.replace('; ', cls._DEFS_SEP)
+        return cls._DEFS_SEP.join(defs)
+
+    @classmethod
+    def _split_defs(cls,
+                    defs: str) -> List[str]:
+        """
+        :param defs: str, definitions in the compact storage format.
+        :return: list of str, definitions.
+        """
+        return defs.split(cls._DEFS_SEP) if defs else []
+
+    @classmethod
+    def _intern_properties(cls,
+                           properties: List[str]) -> Tuple[str, ...]:
+        """ Get the shared tuple of the properties, so the words
+        with the same properties don't keep their own copies.
+
+        :param properties: list of str, formatted and sorted properties.
+        :return: tuple of interned str.
+        """
+        key = ', '.join(properties)
+        interned = cls._PROPERTIES.get(key)
+        if interned is None:
+            interned = tuple(map(sys.intern, properties))
+            cls._PROPERTIES[key] = interned
+        return interned
+
+    @classmethod
+    def from_fields(cls,
+                    word_id: str,
+                    word: str,
+                    date: datetime.date,
+                    properties: Tuple[str, ...],
+                    english_defs: str,
+                    russian_defs: str) -> Any:
+        """ Create a Word from its fields in the storage format,
+        they aren't validated or converted.
+
+        :param word_id: str, id of the word.
+        :param word: str, formatted word.
+        :param date: datetime.date, date of the word.
+        :param properties: tuple of str, shared tuple of the properties.
+        :param english_defs: str, English defs joined with the separator.
+        :param russian_defs: str, Russian defs joined with the separator.
+        :return: Word obj.
+        """
+        self = cls.__new__(cls)
+        self._id, self._word, self._date = word_id, word, date
         self._properties = properties
+        self._english_defs, self._russian_defs = english_defs, russian_defs
+        return self
+
+    @classmethod
+    def from_row(cls,
+                 word_id: str,
+                 word: str,
+                 date: str,
+                 properties: str,
+                 english: str,
+                 russian: str) -> Any:
+        """ Create a Word from the fields stored in the database.
+
+        The fields have been normalized before storing, so they
+        aren't validated again and the stored id is used.
+
+        :param word_id: str, stored id of the word.
+        :param word: str, word.
+        :param date: str, date in ISO format.
+        :param properties: str, properties in format: '[prop1, prop2]'.
+        :param english: str, English definitions joined with '; '.
+        :param russian: str, Russian definitions joined with '; '.
+        :return: Word obj.
+        """
+        self = cls.__new__(cls)
+        self._word = word
+        self._id = word_id or comm_funcs.word_id(word)
+
+        date = date[:10]
+        self._date = cls._DATES.get(date)
+        if self._date is None:
+            self._date = cls._DATES[date] = datetime.date.fromisoformat(date)
+
+        if properties.startswith('[') and properties.endswith(']'):
+            properties = properties[1:-1]
+        self._properties = cls._PROPERTIES.get(properties)
+        if self._properties is None:
+            self._properties = cls._intern_properties(
+                properties.split(', ') if properties else [])
+
+        self._english_defs = english.replace('; ', cls._DEFS_SEP)
+        self._russian_defs = russian.replace('; ', cls._DEFS_SEP)
+        return self
 
     @property
     def word(self) -> str:
@@ -132,31 +275,31 @@ class Word:
         """
         :return: list of str, English defs.
         """
-        return self._english_defs
+        return self._split_defs(self._english_defs)
 
     @property
     def russian(self) -> List[str]:
         """
         :return: list of str, Russian defs.
         """
-        return self._russian_defs
+        return self._split_defs(self._russian_defs)
 
     @property
     def properties(self) -> List[str]:
         """
         :return: list of str, word's properties.
         """
-        return self._properties
+        return list(self._properties)
 
     @property
     def fields(self) -> Dict:
         """
         :return: dict of str and datetime.date, all word fields.
         """
-        props = f"[{', '.join(self.properties)}]" * bool(self.properties)
+        props = f"[{', '.join(self._properties)}]" * bool(self._properties)
 
-        english = '; '.join(self.english)
-        russian = '; '.join(self.russian)
+        english = self._english_defs.replace(self._DEFS_SEP, '; ')
+        russian = self._russian_defs.replace(self._DEFS_SEP, '; ')
 
         return {
             'id': self.id,
@@ -190,7 +333,7 @@ class Word:
         :return: bool, whether the word fit with the all properties.
         """
         return all(
-            comm_funcs.fmt_str(prop) in self.properties
+            comm_funcs.fmt_str(prop) in self._properties
             for prop in properties
         )
 
@@ -232,6 +375,31 @@ class Word:
             other.russian + self.russian
         )
 
+    def merge(self,
+              other: Any) -> Any:
+        """ Join the defs and the properties of the other Word
+        to the ones of this Word, repeated ones are skipped.
+
+        :param other: Word to join.
+        :return: Word obj, joined items, learned on the earlier date.
+        :exception TypeError: if wrong type given.
+        :exception ValueError: if the words aren't equal.
+        """
+        if not isinstance(other, Word):
+            raise TypeError(f"Word expected, but '{type(other)}' given")
+        if self.word != other.word:
+            raise ValueError("Only the equal words can be merged")
+
+        # dicts keep the order of the items
+        return Word(
+            self.word,
+            min(self.date, other.date),
+            self.properties + other.properties,
+            list(dict.fromkeys(self.english + other.english)),
+            list(dict.fromkeys(self.russian + other.russian)),
+            self.id
+        )
+
     def __eq__(self,
                other: Any) -> bool:
         """ ==
@@ -246,7 +414,7 @@ class Word:
             return self.word == other.strip()
         if isinstance(other, Word):
             return (self.word == other.word and
-                    self.properties == other.properties)
+                    self._properties == other._properties)
 
         raise TypeError(f"Demanded str or Word, but '{type(other)}' given")
 
@@ -255,30 +423,39 @@ class Word:
         """ != """
         return not (self == other)
 
-    def __gt__(self,
-               other: Any) -> bool:
-        """ > """
-        if isinstance(other, str):
-            return self.word > other.strip()
+    def _other_word(self,
+                    other: Any) -> str:
+        """
+        :param other: str or Word to compare with.
+        :return: str, the word to compare with.
+        :exception TypeError: if wrong type given.
+        """
         if isinstance(other, Word):
-            return self.word > other.word
+            return other._word
+        if isinstance(other, str):
+            return other.strip()
 
         raise TypeError(f"Demanded str or Word, but '{type(other)}' given")
 
+    def __gt__(self,
+               other: Any) -> bool:
+        """ > """
+        return self._word > self._other_word(other)
+
     def __lt__(self,
                other: Any) -> bool:
         """ < """
-        return self != other and not (self > other)
+        return self._word < self._other_word(other)
 
     def __ge__(self,
                other: Any) -> bool:
         """ >= """
-        return self > other or self == other
+        return self._word >= self._other_word(other)
 
     def __le__(self,
                other: Any) -> bool:
         """ <= """
-        return self < other or self == other
+        return self._word <= self._other_word(other)
 
     def __len__(self) -> int:
         """
@@ -319,10 +496,16 @@ class Word:
         return f"{word}{properties} – {eng}{rus}"
 
     def __hash__(self) -> int:
+        """ Equal Words have the same word, so the hash is
+        the word's one, str caches it.
+
+        Word equal to str with surrounding spaces, because __eq__
+        strips it, hashes differently: only the stripped str
+        has the same hash, so look up Words by stripped strs.
+
+        :return: int, hash of the word.
         """
-        :return: int, hash the word and the properties.
-        """
-        return sum(self.word) + hash(self.properties)
+        return hash(self._word)
 
     def __repr__(self) -> str:
         """ Str format:
@@ -340,19 +523,470 @@ class Word:
         return res
 
 
+class PagedWords(Sequence):
+    """ Read-only sequence of the Words stored in the table.
+
+    Rows are loaded from the database by pages on demand,
+    the amount of the cached pages is bounded.
+    """
+    __slots__ = (
+        '_db', '_template', '_next_rowids', '_rowids',
+        '_pages', '_page_size', '_max_pages')
+
+    def __init__(self,
+                 db: sqlite3.Connection or connection.ConnectionManager,
+                 template: str,
+                 table: str,
+                 page_size: int = 512,
+                 max_pages: int = 32) -> None:
+        """
+        :param db: sqlite3.Connection or ConnectionManager of the database.
+        :param template: str, query to select Word fields from the table.
+        :param table: str, name of the table.
+        :param page_size: int, amount of the rows in one page.
+        :param max_pages: int, max amount of the cached pages.
+        :return: None.
+        """
+        self._db = db
+        self._template = f"{template.format(table=table)} " \
+                         f"WHERE rowid BETWEEN ? AND ? ORDER BY rowid"
+        self._page_size = page_size
+        self._max_pages = max_pages
+        # number of the page – its Words, the last used is the last one
+        self._pages: OrderedDict[int, List[Word]] = OrderedDict()
+
+        rowids = self._db.execute(
+            f""" SELECT rowid FROM {table} ORDER BY rowid """
+        )
+        self._rowids = array.array('q', (row[0] for row in rowids))
+        self._next_rowids = f""" SELECT rowid FROM {table} 
+                                  WHERE rowid > ? ORDER BY rowid LIMIT ? """
+
+    def _page(self,
+              number: int) -> List[Word]:
+        """ Get the page from the cache or load it from the database.
+
+        :param number: int, number of the page.
+        :return: list of Words on the page.
+        """
+        if number in self._pages:
+            self._pages.move_to_end(number)
+            return self._pages[number]
+
+        start = number * self._page_size
+        rowids = self._rowids[start:start + self._page_size]
+        rows = self._db.execute(self._template, (rowids[0], rowids[-1]))
+        page = [
+            Word.from_row(*fields)
+            for fields in rows.fetchall()
+        ]
+
+        self._pages[number] = page
+        if len(self._pages) > self._max_pages:
+            self._pages.popitem(last=False)
+        return page
+
+    def extend(self,
+               items: List[Word]) -> None:
+        """ Register the rows which have been added to the end of the table.
+
+        :param items: list of Words, which have been added.
+        :return: None.
+        """
+        if not items:
+            return
+
+        last_rowid = self._rowids[-1] if self._rowids else 0
+        rowids = self._db.execute(self._next_rowids, (last_rowid, len(items)))
+        # the last page might have been changed
+        self._pages.pop((len(self) - 1) // self._page_size, None)
+        self._rowids.extend(row[0] for row in rowids.fetchall())
+
+    def __getitem__(self,
+                    item: int or slice) -> Word or List[Word]:
+        """ Get the Word at the position or the list of Words.
+
+        :param item: int or slice.
+        :return: Word or list of Words.
+        :exception TypeError: if wrong type given.
+        :exception IndexError: if the position is out of range.
+        """
+        if isinstance(item, slice):
+            return [
+                self[position]
+                for position in range(*item.indices(len(self)))
+            ]
+        if not isinstance(item, int):
+            raise TypeError(f"Int or slice expected, but '{type(item)}' given")
+
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError("Word index out of range")
+
+        number, offset = divmod(item, self._page_size)
+        return self._page(number)[offset]
+
+    def __setitem__(self,
+                    position: int,
+                    word: Word) -> None:
+        """ Replace the Word at the position in the cached page.
+        The row in the database must have already been changed.
+
+        :param position: int, position of the word.
+        :param word: Word to put there.
+        :return: None.
+        """
+        number, offset = divmod(position, self._page_size)
+        if number in self._pages:
+            self._pages[number][offset] = word
+
+    def __iter__(self) -> iter:
+        """
+        :return: iter to the Words, page by page.
+        """
+        pages_count = -(-len(self) // self._page_size)
+        for number in range(pages_count):
+            yield from self._page(number)
+
+    def __len__(self) -> int:
+        """
+        :return: int, amount of the rows.
+        """
+        return len(self._rowids)
+
+
+class SnapshotWords(Sequence):
+    """ Sequence of the Words stored in the snapshot file.
+
+    The file is mapped to the memory, a Word is created from its
+    bytes when it's requested for the first time.
+
+    File format: header, columns, properties and rows.
+    Header: magic bytes, version of the format, byteorder of the
+    columns, state of the database, amount of the words, of the
+    unique dates and properties, length of the properties.
+    Columns, raw arrays of the machine ints: offsets of the rows,
+    ordinals of the unique dates, codes of the date and of
+    the properties of every word.
+    Properties: unique properties joined with _SEP.
+    Row: id, word, English and Russian defs joined with _SEP.
+    """
+    __slots__ = (
+        '_words', '_rows', '_offsets', '_dates',
+        '_date_codes', '_properties', '_property_codes')
+    _MAGIC = b'VOCS'
+    # increase it when the format or Word fields change
+    _VERSION = 2
+    # the padding keeps the columns aligned
+    _HEADER = struct.Struct('<4sHc16sIIIQ5x')
+    _BYTEORDER = sys.byteorder[0].encode()
+    _SEP = '\x1e'
+
+    def __init__(self,
+                 rows: memoryview,
+                 offsets: Sequence,
+                 dates: List[datetime.date],
+                 date_codes: Sequence,
+                 properties: List[Tuple[str, ...]],
+                 property_codes: Sequence) -> None:
+        """
+        :param rows: memoryview of the encoded rows.
+        :param offsets: array or memoryview of int, offsets of the rows,
+        the last one is the end of the last row.
+        :param dates: list of datetime.date, unique dates.
+        :param date_codes: array or memoryview of int,
+        indexes of the dates of the words.
+        :param properties: list of tuples of str, unique properties.
+        :param property_codes: array or memoryview of int, indexes
+        of the properties of the words.
+        :return: None.
+        """
+        self._rows = rows
+        self._offsets = offsets
+        self._dates = dates
+        self._date_codes = date_codes
+        self._properties = [
+            Word._intern_properties(list(item))
+            for item in properties
+        ]
+        self._property_codes = property_codes
+        # created Words, None if the Word hasn't been requested yet
+        self._words: List[Word or None] = [None] * (len(offsets) - 1)
+
+    @classmethod
+    def load(cls,
+             path: Path,
+             state: bytes) -> Any:
+        """ Map the snapshot file to the memory.
+
+        The columns of the words aren't copied,
+        they're the cast views of the mapped file.
+
+        :param path: Path to the snapshot file.
+        :param state: bytes, current state of the database.
+        :return: SnapshotWords obj or None if the file doesn't
+        exist, it's broken or it has been created for another state.
+        """
+        try:
+            with path.open('rb') as file:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        try:
+            (magic, version, byteorder, snapshot_state, words_count,
+             dates_count, properties_count, properties_length) = \
+                cls._HEADER.unpack_from(mapped)
+            if (magic, version, byteorder, snapshot_state) != \
+                    (cls._MAGIC, cls._VERSION, cls._BYTEORDER, state):
+                mapped.close()
+                return None
+
+            # offsets, ordinals of the dates, codes of the
+            # dates and of the properties, properties, rows
+            bounds = list(itertools.accumulate(
+                (cls._HEADER.size, 8 * (words_count + 1), 4 * dates_count,
+                 4 * words_count, 4 * words_count, properties_length)))
+            # the end of the rows is the last offset
+            rows_length, = struct.unpack_from('Q', mapped, bounds[1] - 8)
+            properties = str(mapped[bounds[4]:bounds[5]], 'utf-8')
+            properties = properties.split(cls._SEP) if properties_count else []
+            # there are few dates, they're copied
+            dates = [
+                datetime.date.fromordinal(ordinal)
+                for ordinal in array.array('I', mapped[bounds[1]:bounds[2]])
+            ]
+            if len(properties) != properties_count or \
+                    len(mapped) != bounds[5] + rows_length:
+                raise ValueError("The snapshot is broken")
+        except (struct.error, ValueError):
+            mapped.close()
+            return None
+
+        view = memoryview(mapped)
+        offsets, date_codes, property_codes = (
+            view[bounds[number]:bounds[number + 1]].cast(fmt)
+            for number, fmt in ((0, 'Q'), (2, 'I'), (3, 'I'))
+        )
+        return cls(
+            view[bounds[5]:], offsets, dates, date_codes,
+            [tuple(item.split(', ')) if item else () for item in properties],
+            property_codes
+        )
+
+    @classmethod
+    def save(cls,
+             path: Path,
+             words: Iterable[Word],
+             state: bytes) -> None:
+        """ Write the snapshot file, the old one is replaced at once.
+
+        :param path: Path to the snapshot file.
+        :param words: iterable of Words to write.
+        :param state: bytes, current state of the database.
+        :return: None.
+        :exception OSError: if the file can't be written.
+        """
+        rows, offsets = [], array.array('Q', [0])
+        # date or properties – its code
+        dates: Dict[datetime.date, int] = {}
+        properties: Dict[Tuple[str, ...], int] = {}
+        date_codes, property_codes = array.array('I'), array.array('I')
+
+        for word in words:
+            row = cls._SEP.join((
+                word._id, word._word,
+                word._english_defs, word._russian_defs)).encode('utf-8')
+            rows += [row]
+            offsets.append(offsets[-1] + len(row))
+            date_codes.append(dates.setdefault(word._date, len(dates)))
+            property_codes.append(
+                properties.setdefault(word._properties, len(properties)))
+
+        ordinals = array.array('I', map(datetime.date.toordinal, dates))
+        properties_blob = cls._SEP.join(
+            ', '.join(item) for item in properties).encode('utf-8')
+        header = cls._HEADER.pack(
+            cls._MAGIC, cls._VERSION, cls._BYTEORDER, state, len(rows),
+            len(dates), len(properties), len(properties_blob))
+
+        temp_path = path.with_name(f"{path.name}.tmp")
+        with temp_path.open('wb') as file:
+            file.write(header)
+            for column in (offsets, ordinals, date_codes, property_codes):
+                column.tofile(file)
+            file.write(properties_blob)
+            file.writelines(rows)
+        os.replace(temp_path, path)
+
+    def _word(self,
+              position: int) -> Word:
+        """ Create the Word from its row.
+
+        :param position: int, position of the word.
+        :return: Word obj.
+        """
+        row = self._rows[self._offsets[position]:self._offsets[position + 1]]
+        word_id, word, english, russian = str(row, 'utf-8').split(self._SEP)
+        return Word.from_fields(
+            word_id, word,
+            self._dates[self._date_codes[position]],
+            self._properties[self._property_codes[position]],
+            english, russian
+        )
+
+    def extend(self,
+               items: List[Word]) -> None:
+        """ Add the Words to the end.
+
+        :param items: list of Words to add.
+        :return: None.
+        """
+        self._words.extend(items)
+
+    def __getitem__(self,
+                    item: int or slice) -> Word or List[Word]:
+        """ Get the Word at the position or the list of Words.
+
+        :param item: int or slice.
+        :return: Word or list of Words.
+        :exception TypeError: if wrong type given.
+        :exception IndexError: if the position is out of range.
+        """
+        if isinstance(item, slice):
+            return [
+                self[position]
+                for position in range(*item.indices(len(self)))
+            ]
+        if not isinstance(item, int):
+            raise TypeError(f"Int or slice expected, but '{type(item)}' given")
+
+        word = self._words[item]
+        if word is None:
+            if item < 0:
+                item += len(self)
+            word = self._words[item] = self._word(item)
+        return word
+
+    def __setitem__(self,
+                    position: int,
+                    word: Word) -> None:
+        """ Replace the Word at the position.
+
+        :param position: int, position of the word.
+        :param word: Word to put there.
+        :return: None.
+        """
+        self._words[position] = word
+
+    def __iter__(self) -> iter:
+        """
+        :return: iter to the Words.
+        """
+        for position in range(len(self)):
+            yield self[position]
+
+    def __len__(self) -> int:
+        """
+        :return: int, amount of the Words.
+        """
+        return len(self._words)
+
+
+def _merge_defs(stored: str,
+                added: str) -> str:
+    """ Merge the definitions, repeated ones are skipped.
+
+    :param stored: str, stored definitions joined with '; '.
+    :param added: str, added definitions joined with '; '.
+    :return: str, merged definitions joined with '; '.
+    """
+    defs = (stored or '').split('; ') + (added or '').split('; ')
+    # dict keeps the order of the definitions
+    return '; '.join(dict.fromkeys(filter(None, defs)))
+
+
+def _merge_properties(stored: str,
+                      added: str) -> str:
+    """ Merge the properties, repeated ones are skipped.
+
+    :param stored: str, stored properties in format: '[prop1, prop2]'.
+    :param added: str, added properties in the same format.
+    :return: str, merged properties in the same format.
+    """
+    properties = Word.fmt_properties(
+        Word.fmt_properties(stored) + Word.fmt_properties(added))
+    return f"[{', '.join(properties)}]" * bool(properties)
+
+
 class Vocabulary:
-    __slots__ = '_data', 'graphic_name', '_cursor', '_db'
+    __slots__ = (
+        '_data', 'graphic_name', '_connections', '_db_path',
+        '_indexes', '_stats_cache', '_frame')
     _TABLE_NAME = 'Vocabulary'
     _RESTRICT_SHOW = 50
-    _TEMPLATE_TO_WORD = "SELECT word, date, properties, " \
+    _TEMPLATE_TO_WORD = "SELECT id, word, date, properties, " \
                         "English, Russian from {table} "
+    _INSERT_WORD = "INSERT INTO {table} (id, date, word, properties, " \
+                   "transcription, English, Russian) VALUES (:id, :date, " \
+                   ":word, :properties, '', :English, :Russian)"
+    _UPDATE_WORD = "UPDATE {table} SET date = :date, word = :word, " \
+                   "properties = :properties, English = :English, " \
+                   "Russian = :Russian WHERE id = :id"
+    _UPSERT_WORD = f"{_INSERT_WORD} ON CONFLICT (id) DO UPDATE SET " \
+                   "date = MIN(date, excluded.date), " \
+                   "properties = merge_properties(properties, " \
+                   "excluded.properties), " \
+                   "English = merge_defs(English, excluded.English), " \
+                   "Russian = merge_defs(Russian, excluded.Russian)"
+    _IGNORE_WORD = f"{_INSERT_WORD} ON CONFLICT (id) DO NOTHING"
+    _REPLACE_WORD = f"{_INSERT_WORD} ON CONFLICT (id) DO UPDATE SET " \
+                    "date = excluded.date, word = excluded.word, " \
+                    "properties = excluded.properties, " \
+                    "English = excluded.English, Russian = excluded.Russian"
+    # conflict policy – statement to write the words
+    _WRITE_WORD = {
+        None: _INSERT_WORD,
+        'ignore': _IGNORE_WORD,
+        'replace': _REPLACE_WORD,
+        'merge': _UPSERT_WORD,
+    }
+    _ON_CONFLICT = tuple(_WRITE_WORD)
+    # max amount of the bound parameters in one SQLite query
+    _MAX_VARIABLES = 999
+    # names of the schema migrations, n-th one upgrades
+    # the database to the version n + 1
+    _MIGRATIONS = (
+        '_index_columns', '_make_ids_unique', '_index_definitions')
+    # columns with the definitions in the full-text index
+    _LANGUAGES = 'English', 'Russian'
+    # name – class of the indexes over the data list
+    _INDEXES = {
+        'id': indexes.IdIndex,
+        'ngram': indexes.NgramIndex,
+        'properties': indexes.PropertyIndex,
+        'date': indexes.DateIndex,
+        'sorted': indexes.SortedIndex,
+        'fuzzy': indexes.FuzzyIndex,
+    }
 
     def __init__(self,
-                 db_path: Path) -> None:
+                 db_path: Path,
+                 lazy: bool = False,
+                 snapshot: bool = False) -> None:
         """" Create a connection to database, cursor,
         load Words from there.
 
         :param db_path: Path to the database.
+        :param lazy: bool, whether the Words will be loaded
+        by pages on demand instead of loading all of them now.
+        :param snapshot: bool, whether the Words will be loaded from
+        the snapshot file next to the database if it's up to date.
+        Otherwise they are loaded from the database and the snapshot
+        is written. Then the data list is read-only SnapshotWords,
+        it's list only if the snapshot can't be written.
+        Isn't used in the lazy mode.
         :return: None.
         :exception FileNotFoundError: if the database file doesn't exist.
         :exception sqlite3.Error: if something went wrong while connecting to db.
@@ -360,14 +994,40 @@ class Vocabulary:
         if not db_path.exists():
             raise FileNotFoundError("DB file doesn't exist")
         
+        self._connections = connection.get_manager(db_path)
         try:
-            self._db = sqlite3.connect(db_path)
+            self._connections.connection
         except sqlite3.Error:
             print("Something went wrong while connecting to the database")
             raise
         
-        self._cursor = self._db.cursor()
-        self._data = self._load()
+        # functions to merge the stored rows with the added words
+        self._connections.create_function(
+            'merge_defs', 2, _merge_defs, deterministic=True)
+        self._connections.create_function(
+            'merge_properties', 2, _merge_properties, deterministic=True)
+
+        self._migrate()
+        self._db_path = db_path
+        if lazy:
+            self._data = PagedWords(
+                self._connections, self._TEMPLATE_TO_WORD, self._TABLE_NAME)
+        elif snapshot:
+            self._data = SnapshotWords.load(
+                self.snapshot_path, self._db_state())
+            if self._data is None:
+                self._data = self._load()
+                self.save_snapshot()
+                # the data list is the same on the cold and the warm start
+                self._data = SnapshotWords.load(
+                    self.snapshot_path, self._db_state()) or self._data
+        else:
+            self._data = self._load()
+        # indexes are built on the first request
+        self._indexes = {}
+        # aggregates are calculated on the first request
+        self._stats_cache = None
+        self._frame = None
 
         # filename with dynamics of learning
         self.graphic_name = (consts.TABLE_FOLDER /
@@ -384,6 +1044,138 @@ class Vocabulary:
         """
         cls._RESTRICT_SHOW = new_value
 
+    @property
+    def _db(self) -> sqlite3.Connection:
+        """
+        :return: sqlite3.Connection of the current thread.
+        """
+        return self._connections.connection
+
+    @property
+    def _cursor(self) -> sqlite3.Cursor:
+        """
+        :return: sqlite3.Cursor of the current thread.
+        """
+        return self._connections.cursor
+
+    def _migrate(self) -> None:
+        """ Upgrade the database schema to the last version.
+
+        The version is kept in 'PRAGMA user_version', every
+        migration is applied in its own transaction. The transaction
+        is rolled back whatever error breaks the migration, otherwise
+        it'd stay open on the shared connection of the thread.
+
+        :return: None.
+        :exception Exception: if the migration failed.
+        """
+        version = self._cursor.execute("PRAGMA user_version").fetchone()[0]
+        for number, migration in enumerate(self._MIGRATIONS[version:], version):
+            try:
+                self._cursor.execute("BEGIN")
+                getattr(self, migration)()
+                self._cursor.execute(f"PRAGMA user_version = {number + 1}")
+                self._db.commit()
+            except Exception:
+                print(f"Migration to the version {number + 1} failed")
+                self._db.rollback()
+                raise
+
+    def _index_columns(self) -> None:
+        """ Migration: create indexes on date, word and id.
+
+        :return: None.
+        """
+        for column in ('date', 'word', 'id'):
+            self._cursor.execute(
+                f""" CREATE INDEX IF NOT EXISTS {self._TABLE_NAME}_{column}
+                      ON {self._TABLE_NAME} ({column}) """
+            )
+
+    def _make_ids_unique(self) -> None:
+        """ Migration: fill empty ids, merge the rows with
+        the same id to one, make the index on id unique.
+
+        The id is counted by the word only, so the rows of the
+        word with different properties, e.g. 'run [verb]' and
+        'run [noun]', become one row with joined properties and
+        definitions: the senses aren't kept apart anymore.
+        The stored words are normalized before merging.
+
+        :return: None.
+        """
+        table = self._TABLE_NAME
+        empty_ids = self._cursor.execute(
+            f""" SELECT rowid, word FROM {table}
+                  WHERE id IS NULL OR id = '' """
+        ).fetchall()
+        self._cursor.executemany(
+            f""" UPDATE {table} SET id = ? WHERE rowid = ? """,
+            [(comm_funcs.word_id(word), rowid) for rowid, word in empty_ids]
+        )
+
+        rows = self._cursor.execute(
+            f""" SELECT rowid, id, word, date, properties, English, Russian
+                  FROM {table} WHERE id IN (
+                    SELECT id FROM {table} GROUP BY id HAVING COUNT(*) > 1)
+                  ORDER BY rowid """
+        )
+        # id – rowid of the first row and the merged Word
+        merged: Dict[str, Tuple[int, Word]] = {}
+        deleted = []
+        for rowid, word_id, word, *fields in rows.fetchall():
+            # the word might have been stored with spaces or in upper case
+            word = Word.from_row(word_id, comm_funcs.fmt_str(word), *fields)
+            if word.id in merged:
+                first_rowid, first_word = merged[word.id]
+                merged[word.id] = first_rowid, first_word.merge(word)
+                deleted += [(rowid,)]
+            else:
+                merged[word.id] = rowid, word
+
+        self._cursor.executemany(
+            self._UPDATE_WORD.format(table=table),
+            (word.fields for _, word in merged.values())
+        )
+        self._cursor.executemany(
+            f""" DELETE FROM {table} WHERE rowid = ? """, deleted)
+        self._cursor.execute(f""" DROP INDEX IF EXISTS {table}_id """)
+        self._cursor.execute(
+            f""" CREATE UNIQUE INDEX {table}_id ON {table} (id) """)
+
+    def _index_definitions(self) -> None:
+        """ Migration: create the full-text index over
+        the definitions, triggers keep it in sync with the table.
+
+        :return: None.
+        """
+        table = self._TABLE_NAME
+        self._cursor.execute(
+            f""" CREATE VIRTUAL TABLE {table}_fts USING fts5(
+                  English, Russian, content='{table}',
+                  content_rowid='rowid', tokenize='unicode61') """
+        )
+        inserted = f""" INSERT INTO {table}_fts (rowid, English, Russian)
+                         VALUES (new.rowid, new.English, new.Russian); """
+        deleted = f""" INSERT INTO {table}_fts ({table}_fts, rowid,
+                        English, Russian) VALUES ('delete', old.rowid,
+                        old.English, old.Russian); """
+        self._cursor.execute(
+            f""" CREATE TRIGGER {table}_fts_insert AFTER INSERT ON {table}
+                  BEGIN {inserted} END """
+        )
+        self._cursor.execute(
+            f""" CREATE TRIGGER {table}_fts_delete AFTER DELETE ON {table}
+                  BEGIN {deleted} END """
+        )
+        self._cursor.execute(
+            f""" CREATE TRIGGER {table}_fts_update
+                  AFTER UPDATE OF English, Russian ON {table}
+                  BEGIN {deleted} {inserted} END """
+        )
+        self._cursor.execute(
+            f""" INSERT INTO {table}_fts ({table}_fts) VALUES ('rebuild') """)
+
     def _load(self) -> List[Word]:
         """
         :return: list of Words loaded from the database.
@@ -391,16 +1183,113 @@ class Vocabulary:
         data = self._cursor.execute(
             self._TEMPLATE_TO_WORD.format(table=self._TABLE_NAME)
         )
-        words = map(
-            lambda fields: Word(*fields),
-            data.fetchall()
-        )
-        return list(words)
+        return [
+            Word.from_row(*fields)
+            for fields in data.fetchall()
+        ]
+
+    def _db_state(self) -> bytes:
+        """ Get the state of the database files, it's
+        changed when something is written to the database.
+
+        The state is the size and the modification time of the
+        database and the journal, the change counter of the
+        database and the salts of the journal, which are changed
+        when the journal is restarted.
+
+        :return: bytes, hash of the state.
+        """
+        state = []
+        for path in (self._db_path,
+                     self._db_path.with_name(f"{self._db_path.name}-wal")):
+            try:
+                stat = path.stat()
+                with path.open('rb') as file:
+                    header = file.read(100)
+            except FileNotFoundError:
+                continue
+            # the empty journal is created on every connection
+            if stat.st_size:
+                state += [stat.st_size, stat.st_mtime_ns, header[12:28]]
+        return hashlib.blake2b(repr(state).encode(), digest_size=16).digest()
 
     @property
-    def data(self) -> List[Word]:
+    def snapshot_path(self) -> Path:
+        """
+        :return: Path to the snapshot file of the Words.
+        """
+        return self._db_path.with_name(f"{self._db_path.name}.snapshot")
+
+    def save_snapshot(self) -> None:
+        """ Write the snapshot of the Words, the next Vocabulary
+        created without changes in the database loads them from it.
+
+        :return: None.
         """
-        :return: list of Words, data.
+        try:
+            SnapshotWords.save(self.snapshot_path, self._data, self._db_state())
+        except OSError:
+            # the snapshot is only the cache
+            print("Snapshot of the Vocabulary can't be written")
+
+    def _index(self,
+               name: str,
+               data: List[Word] = None) -> Any:
+        """ Get the index over the data list, build it if there's no.
+
+        Built indexes are kept in sync with the data list.
+
+        :param name: str, name of the index.
+        :param data: list of Words, the data list if it
+        has already been loaded, by default – the data list.
+        :return: index object.
+        """
+        index = self._indexes.get(name)
+        if index is None:
+            data = self._data if data is None else data
+            index = self._INDEXES[name]()
+            if hasattr(index, 'build'):
+                index.build(data)
+            else:
+                for position, word in enumerate(data):
+                    index.add(position, word)
+            self._indexes[name] = index
+        return index
+
+    def build_indexes(self,
+                      *names: str) -> None:
+        """ Build the indexes ahead of the searches, which need them.
+
+        The fuzzy index is the most expensive one: about 4 s
+        for 100k words, so it's better built in the background.
+
+        :param names: list of str, names of the indexes.
+        By default – all of them.
+        :return: None.
+        :exception ValueError: if the name of the index is wrong.
+        """
+        for name in names:
+            if name not in self._INDEXES:
+                raise ValueError(f"Wrong index: '{name}', "
+                                 f"one of {tuple(self._INDEXES)} expected")
+
+        data = self._data
+        if isinstance(data, PagedWords):
+            data = list(data)
+        for name in names or self._INDEXES:
+            self._index(name, data)
+
+    @property
+    def data(self) -> List[Word] or PagedWords or SnapshotWords:
+        """ Data list: list of Words, PagedWords in the lazy mode or
+        SnapshotWords if the Vocabulary has been created with the snapshot.
+
+        PagedWords and SnapshotWords are read-only sequences: they support
+        indexing, slicing, len(), iteration, 'in', index() and count(),
+        but not the list methods and operators. Use list(vocabulary.data)
+        to get the list.
+
+        :return: list of Words, PagedWords or SnapshotWords, data.
         """
         return self._data
 
@@ -411,7 +1300,7 @@ class Vocabulary:
         :return: datetime.date, first date.
         """
         first_date = self._cursor.execute(
-            f""" SELECT date FROM {self._TABLE_NAME} ORDER BY date """
+            f""" SELECT MIN(date) FROM {self._TABLE_NAME} """
         ).fetchone()
         return comm_funcs.str_to_date(first_date[0])
 
@@ -422,7 +1311,7 @@ class Vocabulary:
         :return: datetime.date, last date.
         """
         last_date = self._cursor.execute(
-            f""" SELECT date FROM {self._TABLE_NAME} ORDER BY date DESC """
+            f""" SELECT MAX(date) FROM {self._TABLE_NAME} """
         ).fetchone()
         return comm_funcs.str_to_date(last_date[0])
 
@@ -433,49 +1322,74 @@ class Vocabulary:
         """
         return (self.end - self.begin).days + 1
 
+    def _stats(self) -> Dict[str, Any]:
+        """ Get all the aggregates about the Vocabulary.
+
+        They are calculated over the columns of the frame
+        and are cached until the Vocabulary changes.
+
+        :return: dict of str and aggregate.
+        """
+        if self._stats_cache is not None:
+            return self._stats_cache
+
+        frame = self.frame()
+        self._stats_cache = {
+            'dynamic': frame.dynamic(),
+            'duration': frame.duration(),
+            'avg_per_day': frame.avg_count_of_words(),
+            'empty_days': frame.empty_days_count(),
+            'max_day': frame.max_day_info(),
+            'min_day': frame.min_day_info(),
+            'statistics': None
+        }
+        return self._stats_cache
+
+    def frame(self) -> Any:
+        """ Get the columnar view of the words for analytics.
+
+        It's built on the first request and is rebuilt
+        after the Vocabulary changes. NumPy is required.
+
+        :return: VocabularyFrame obj.
+        """
+        if self._frame is None:
+            import src.words.frame as frame
+            self._frame = frame.VocabularyFrame(self._data)
+        return self._frame
+
     def dynamic(self) -> Dict[datetime.date, int]:
         """
         :return: dict of datetime.date and int, pairs:
-        date – amount of learned words in this date.
+        date – amount of learned words in this date, sorted by dates.
         """
-        dates = self._cursor.execute(
-            f""" SELECT date FROM {self._TABLE_NAME} """
-        )
-        dates = map(
-            lambda date: comm_funcs.str_to_date(date[0]),
-            dates.fetchall()
-        )
-        dates = list(dates)
-        return dict(Counter(dates))
+        return self._stats()['dynamic'].copy()
 
     def max_day_info(self) -> Tuple[datetime.date, int]:
         """ Get info about the day with max words count.
 
         :return: tuple of datetime.date and int.
         """
-        date_to_amount = max(self.dynamic().items(), key=lambda x: x[1])
-        return date_to_amount
+        return self._stats()['max_day']
 
     def min_day_info(self) -> Tuple[datetime.date, int]:
-        """ Get info about the day with max words count.
+        """ Get info about the day with min words count.
 
         :return: tuple of datetime.date and int.
         """
-        date_to_amount = min(self.dynamic().items(), key=lambda x: x[1])
-        return date_to_amount
+        return self._stats()['min_day']
 
     def avg_count_of_words(self) -> int:
         """
         :return: int, average amount of words learned per one day.
         """
-        count_of_words = self.dynamic().values()
-        return sum(count_of_words) // len(count_of_words)
+        return self._stats()['avg_per_day']
 
     def empty_days_count(self) -> int:
         """
         :return: int, amount of days, the user did nothing.
         """
-        return (self.end - self.begin).days + 1 - len(self.get_date_list())
+        return self._stats()['empty_days']
 
     def statistics(self) -> str:
         """ Statistics about Vocabulary, str format:
@@ -492,37 +1406,36 @@ class Vocabulary:
 
         :return: this str.
         """
-        avg_per_day = self.avg_count_of_words()
-        empty_days = self.empty_days_count()
+        stats = self._stats()
+        if stats['statistics'] is not None:
+            return stats['statistics']
+
+        avg_per_day = stats['avg_per_day']
+        empty_days = stats['empty_days']
         total = len(self)
         would_be_total = total + avg_per_day * empty_days
 
-        max_date, max_amount = self.max_day_info()
-        min_date, min_amount = self.min_day_info()
+        max_date, max_amount = stats['max_day']
+        min_date, min_amount = stats['min_day']
         min_date = min_date.strftime(consts.DATEFORMAT)
         max_date = max_date.strftime(consts.DATEFORMAT)
 
-        return f"Duration: {self.duration} days\n" \
-               f"Average amount of learned words: {avg_per_day}\n" \
-               f"Empty days: {empty_days}\n" \
-               f"Total: {total}\n" \
-               f"Would be total: {would_be_total}\n" \
-               f"Max day: {max_date} = {max_amount}\n" \
-               f"Min day: {min_date} = {min_amount}"
+        stats['statistics'] = \
+            f"Duration: {stats['duration']} days\n" \
+            f"Average amount of learned words: {avg_per_day}\n" \
+            f"Empty days: {empty_days}\n" \
+            f"Total: {total}\n" \
+            f"Would be total: {would_be_total}\n" \
+            f"Max day: {max_date} = {max_amount}\n" \
+            f"Min day: {min_date} = {min_amount}"
+        return stats['statistics']
 
     def get_date_list(self) -> List[datetime.date]:
         """ Get all dates when the user learned something.
 
-        :return: list of datetime.date, all dates.
+        :return: list of datetime.date, all sorted dates.
         """
-        dates = self._cursor.execute(
-            f""" SELECT DISTINCT date FROM {self._TABLE_NAME} """
-        )
-        dates = map(
-            lambda date: comm_funcs.str_to_date(date[0]),
-            dates.fetchall()
-        )
-        return list(dates)
+        return self._index('date').dates[:]
 
     def get_date_span(self,
                       datefmt: str = consts.DATEFORMAT) -> str:
@@ -543,7 +1456,7 @@ class Vocabulary:
         :return: list of Words.
         :exception ValueError: if the index < 0.
         """
-        dates = self.get_date_list()
+        dates = self._index('date').dates
         date_index = len(dates) - days_count - 1
         if date_index < 0:
             raise ValueError("Expected day doesn't exist")
@@ -557,10 +1470,25 @@ class Vocabulary:
         :param reverse: bool, whether the sort will be in reversed order.
         :return: sorted by alphabet list of all words.
         """
-        all_words = self.data[:]
-        all_words.sort(reverse=reverse)
+        return list(self.iter_sorted(reverse))
 
-        return all_words
+    def iter_sorted(self,
+                    reverse: bool = False) -> Iterator[Word]:
+        """ Iterate over the words sorted by alphabet without copying.
+
+        In the lazy mode the words are loaded once in the data order,
+        the sorted positions jump over the pages, so loading them
+        from the bounded page cache would read every page many times.
+
+        :param reverse: bool, whether the sort will be in reversed order.
+        :return: iter to the Words.
+        """
+        data = self._data
+        if isinstance(data, PagedWords):
+            data = list(data)
+
+        for position in self._index('sorted', data).positions(reverse):
+            yield data[position]
 
     def visual_info(self) -> None:
         """ Create a xlsx file with dynamic of learning words.
@@ -572,6 +1500,8 @@ class Vocabulary:
             'y_axis_name': 'Amount of words',
             'chart_title': 'Words learning dynamic'
         }
+        import src.docs.create_doc as create_doc
+
         date_to_count = self.dynamic()
         create_doc.visual_info(self.graphic_name, date_to_count, **kwargs)
 
@@ -582,6 +1512,8 @@ class Vocabulary:
 
         :return: None.
         """
+        import src.docs.create_doc as create_doc
+
         filename = header = self.get_date_span()
         create_doc.create_docx(filename, self.all_words(), header)
 
@@ -612,11 +1544,41 @@ class Vocabulary:
             item = item.word
         item = comm_funcs.fmt_str(item)
 
-        similar_words = filter(
-            lambda word: item in word.word or word.word in item,
-            self.data
-        )
-        return list(similar_words)
+        return [
+            self._data[position]
+            for position in self._index('ngram').search(item)
+        ]
+
+    def fuzzy_search(self,
+                     item: str or Word,
+                     max_distance: int = indexes.FuzzyIndex.MAX_DISTANCE,
+                     limit: int = 5) -> List[Word]:
+        """ Get the closest words to the misspelled item.
+
+        The distance is the least amount of insertions, deletions
+        and substitutions of the symbols to get the word from the item.
+
+        :param item: str or Word, word to find.
+        :param max_distance: int, max distance to the found words.
+        :param limit: int, max amount of the found words.
+        :return: list of Words, sorted by the distance and by the words.
+        :exception TypeError: if wrong type given.
+        :exception ValueError: if the max distance is wrong.
+        """
+        if not isinstance(item, (str, Word)):
+            raise TypeError(f"Wrong item: '{item}'")
+
+        if isinstance(item, Word):
+            item = item.word
+        item = comm_funcs.fmt_str(item)
+
+        found = [
+            self._data[position]
+            for _, _, positions in self._index('fuzzy').search(
+                item, max_distance, limit)
+            for position in positions
+        ]
+        return found[:max(limit, 0)]
 
     def show_graphic(self) -> None:
         """ Show the graphic.
@@ -636,24 +1598,125 @@ class Vocabulary:
         :param properties: list of str, properties.
         :return: list of word, words which are fit with the given properties.
         """
-        fit_words = filter(
-            lambda word: word.is_fit(*properties),
-            self.data
-        )
-        return list(fit_words)
+        if not properties:
+            return self.data[:]
+
+        properties = map(comm_funcs.fmt_str, properties)
+        return [
+            self._data[position]
+            for position in self._index('properties').search(*properties)
+        ]
+
+    def count_by_properties(self,
+                            *properties: str) -> int:
+        """ Count the words which fit with the given properties.
+
+        :param properties: list of str, properties.
+        :return: int, amount of the words.
+        """
+        if not properties:
+            return len(self)
+
+        properties = map(comm_funcs.fmt_str, properties)
+        return self._index('properties').count(*properties)
+
+    def properties_count(self) -> Dict[str, int]:
+        """
+        :return: dict of str and int, property – amount of
+        the words with it, sorted by the properties.
+        """
+        return self._index('properties').counts()
+
+    def has_id(self,
+               word_id: str) -> bool:
+        """
+        :param word_id: str, id to check.
+        :return: bool, whether there's a word with the id.
+        """
+        return word_id in self._index('id')
 
     def search_by_id(self,
                      *ids: str) -> List[Word]:
         """ Find words by their ids.
 
         :param ids: list of str.
-        :return: list of words, words which ids are in the list.
-        """
-        words_by_id = filter(
-            lambda word: word.id in ids,
-            self.data
+        :return: list of words, words which ids are in the list,
+        in the order of the ids.
+        """
+        id_index = self._index('id')
+        # the same id might be requested several times
+        ids = dict.fromkeys(ids)
+        return [
+            self._data[position]
+            for word_id in ids
+            for position in id_index.get(word_id)
+        ]
+
+    def search_definitions(self,
+                           item: str,
+                           language: str = None,
+                           limit: int = None) -> List[Word]:
+        """ Find the words which definitions contain all words of
+        the item, the words of the item might be the beginnings.
+
+        :param item: str, words to find.
+        :param language: str, 'English' or 'Russian', the definitions
+        to search in. By default – both of them.
+        :param limit: int, max amount of the found words.
+        By default – all of them.
+        :return: list of Words, the most relevant ones go first.
+        :exception TypeError: if wrong type given.
+        :exception ValueError: if wrong language given.
+        """
+        if not isinstance(item, str):
+            raise TypeError(f"str expected, but '{type(item)}' given")
+        if language is not None and language not in self._LANGUAGES:
+            raise ValueError(f"Wrong language: '{language}', "
+                             f"one of {self._LANGUAGES} expected")
+
+        # quoted prefix queries, the FTS5 syntax in the item is ignored
+        terms = [
+            f'"{term}"*'
+            for term in re.findall(r'\w+', item.lower())
+        ]
+        if not terms:
+            return []
+        query = ' '.join(terms)
+        if language is not None:
+            query = f"{language}: ({query})"
+
+        table = self._TABLE_NAME
+        ids = self._cursor.execute(
+            f""" SELECT {table}.id FROM {table}_fts
+                  JOIN {table} ON {table}.rowid = {table}_fts.rowid
+                  WHERE {table}_fts MATCH ? ORDER BY rank LIMIT ? """,
+            (query, -1 if limit is None else limit)
         )
-        return list(words_by_id)
+        return self.search_by_id(*(word_id for word_id, in ids.fetchall()))
+
+    def say_in_english(self,
+                       russian: str,
+                       limit: int = None) -> List[Word]:
+        """ How to say it in English?
+
+        :param russian: str, Russian words to find.
+        :param limit: int, max amount of the found words.
+        :return: list of Words with the Russian definitions,
+        the most relevant ones go first.
+        """
+        return self.search_definitions(russian, 'Russian', limit)
+
+    def say_in_russian(self,
+                       english: str,
+                       limit: int = None) -> List[Word]:
+        """ How to say it in Russian?
+
+        :param english: str, English words to find.
+        :param limit: int, max amount of the found words.
+        :return: list of Words with the English definitions,
+        the most relevant ones go first.
+        """
+        return self.search_definitions(english, 'English', limit)
 
     def how_to_say_in_russian(self) -> List[str]:
         """
@@ -679,57 +1742,292 @@ class Vocabulary:
         """
         pass
 
-    def _add_word_to_db(self,
-                        item: Word) -> None:
-        """ Add a word to the database.
+    def _existing_ids(self,
+                      ids: List[str]) -> Set[str]:
+        """ Get the ids from the list which are already in the database.
+
+        :param ids: list of str, ids to check.
+        :return: set of str, ids found in the database.
+        """
+        existing = set()
+        # keep the amount of the bound parameters under the SQLite limit
+        for start in range(0, len(ids), self._MAX_VARIABLES):
+            chunk = ids[start:start + self._MAX_VARIABLES]
+            placeholders = ', '.join('?' * len(chunk))
+            found = self._cursor.execute(
+                f""" SELECT id FROM {self._TABLE_NAME} 
+                      WHERE id IN ({placeholders}) """,
+                chunk
+            )
+            existing.update(row[0] for row in found.fetchall())
+        return existing
 
-        :param item: Word to add.
+    def _add_words_to_db(self,
+                         items: List[Word],
+                         on_conflict: str = None
+                         ) -> Tuple[List[Word], Dict[str, Word], Dict[int, Word]]:
+        """ Add the words to the database in one transaction.
+
+        The transaction is committed if all the words have been
+        written, otherwise it's rolled back and nothing is written.
+
+        :param items: list of Words to add.
+        :param on_conflict: str, what to do with the words which ids
+        are already in the database: None – fail, the words with
+        the same id in the items are merged, 'ignore' – skip them,
+        'replace' – overwrite the stored rows, 'merge' – join their
+        defs and properties to the stored rows.
+        :return: tuple of the inserted Words, dict of id – Word,
+        which have replaced the stored ones, and dict of position –
+        the stored Word there, which has been replaced.
+        :exception TypeError: if wrong type given.
+        :exception ValueError: if the conflict policy is wrong.
+        :exception sqlite3.Error: if the words can't be written.
+        """
+        if on_conflict not in self._ON_CONFLICT:
+            raise ValueError(f"Wrong conflict policy: '{on_conflict}', "
+                             f"one of {self._ON_CONFLICT} expected")
+        for item in items:
+            if not isinstance(item, Word):
+                raise TypeError(f"Word expected, but '{type(item)}' given")
+
+        inserted, replaced = items, {}
+        if on_conflict is None:
+            # the id is counted by the word only, so the same word with
+            # different properties is merged to one row, see extend()
+            to_insert = {}
+            for item in items:
+                stored = to_insert.get(item.id)
+                to_insert[item.id] = stored.merge(item) if stored else item
+            inserted = list(to_insert.values())
+        else:
+            existing = self._existing_ids([item.id for item in items])
+            # id – Word to insert, the dict keeps the order of the words
+            to_insert = {}
+            for item in items:
+                target = replaced if item.id in existing else to_insert
+                if on_conflict == 'merge':
+                    stored = target.get(item.id)
+                    if stored is None and target is replaced:
+                        stored = next(iter(self.search_by_id(item.id)), item)
+                    target[item.id] = stored.merge(item) if stored else item
+                # with 'replace' the last one of the equal words wins
+                elif on_conflict == 'replace' or item.id not in target:
+                    target[item.id] = item
+            if on_conflict == 'ignore':
+                replaced = {}
+            inserted = list(to_insert.values())
+
+        # the replaced words are read before the write, in the lazy mode
+        # the evicted page would be loaded with the changed rows
+        id_index = self._index('id') if replaced else None
+        previous = {
+            position: self._data[position]
+            for word_id in replaced
+            for position in id_index.get(word_id)
+        }
+
+        # the conflicts are resolved by SQLite, another connection might
+        # have written the same ids since they have been checked,
+        # the check only gives the delta of the data list
+        with self._db:
+            self._cursor.executemany(
+                self._WRITE_WORD[on_conflict].format(table=self._TABLE_NAME),
+                (item.fields for item in (items if on_conflict else inserted))
+            )
+        return inserted, replaced, previous
+
+    def _apply(self,
+               inserted: List[Word],
+               replaced: Dict[str, Word] = None,
+               previous: Dict[int, Word] = None) -> None:
+        """ Apply the words written to the database to the data list.
+
+        Only the delta is applied, the table isn't reloaded,
+        so the cost depends on the amount of the written words.
+
+        :param inserted: list of Words, which have been added to the database.
+        :param replaced: dict of str and Word, id – Word which
+        has replaced the stored ones.
+        :param previous: dict of int and Word, position – the stored
+        Word there, read before the write.
         :return: None.
-        :exception TypeError: of wrong type given.
         """
-        if not isinstance(item, Word):
-            raise TypeError(f"Word expected, but '{type(item)}' given")
-
-        self._cursor.execute(
-            """ INSERT INTO Vocabulary (id, date, word, properties, 
-            transcription, English, Russian) VALUES (:id, :date, 
-            :word, :properties, '', :English, :Russian) """,
-            item.fields
-        )
-        self._db.commit()
+        previous = previous or {}
+        if inserted or replaced:
+            self._stats_cache = None
+            self._frame = None
+
+        if replaced:
+            id_index = self._index('id')
+            for word_id, word in replaced.items():
+                for position in id_index.get(word_id)[:]:
+                    self._reindex(position, word, previous.get(position))
+
+        first_position = len(self._data)
+        self._data.extend(inserted)
+        for position, word in enumerate(inserted, first_position):
+            for index in self._indexes.values():
+                index.add(position, word)
+
+    def _reindex(self,
+                 position: int,
+                 word: Word,
+                 stored: Word = None) -> None:
+        """ Put the word to the position of the data list,
+        update the indexes.
+
+        :param position: int, position of the word to replace.
+        :param word: Word to put there.
+        :param stored: Word, which is there now. By default –
+        the one got from the data list.
+        :return: None.
+        """
+        if stored is None:
+            stored = self._data[position]
+        for index in self._indexes.values():
+            index.discard(position, stored)
+        self._data[position] = word
+        for index in self._indexes.values():
+            index.add(position, word)
 
     def append(self,
-               item: Word) -> None:
+               item: Word,
+               on_conflict: str = None) -> None:
         """ Add a Word to the database.
 
         Update the data list.
 
         :param item: Word to add.
+        :param on_conflict: str, what to do if the word is
+        already in the database, see extend().
         :return: None.
         :exception TypeError: if wrong type given.
         """
-        try:
-            self._add_word_to_db(item)
-        except Exception:
-            raise
-        self._data = self._load()
+        self.extend([item], on_conflict=on_conflict)
 
     def extend(self,
-               items: List[Word]) -> None:
+               items: List[Word],
+               chunk_size: int = None,
+               on_conflict: str = None) -> None:
         """ Extend the database.
 
+        The words are written with one transaction per chunk,
+        every chunk is written completely or isn't written at all.
+
+        The id is counted by the word only, so one word is kept in
+        one row: the words of a chunk with the same id, e.g. 'run [verb]'
+        and 'run [noun]', are merged to one Word with joined properties
+        and definitions, learned on the earlier date. The merge is lossy,
+        which definitions belong to which properties isn't kept.
+
         Update the data list.
 
         :param items: list of Words to add.
+        :param chunk_size: int, amount of words written in one
+        transaction. By default all words are written in one.
+        :param on_conflict: str, what to do with the words which ids
+        are already in the database: None – fail, 'ignore' – skip them,
+        'replace' – overwrite the stored ones, 'merge' – join their
+        defs and properties to the stored ones.
         :return: None.
         :exception TypeError: if wrong type give.
+        :exception ValueError: if the chunk size or the
+        conflict policy is wrong.
+        :exception sqlite3.IntegrityError: if the id is already
+        in the database and there's no conflict policy.
         """
-        for word in items:
-            try:
-                self._add_word_to_db(word)
-            except Exception:
-                raise
-        self._data = self._load()
+        items = list(items)
+        chunk_size = chunk_size or len(items) or 1
+        if chunk_size < 1:
+            raise ValueError(f"Chunk size must be > 0, but {chunk_size} given")
+
+        for start in range(0, len(items), chunk_size):
+            chunk = items[start:start + chunk_size]
+            self._apply(*self._add_words_to_db(chunk, on_conflict))
+
+    @staticmethod
+    def _word_range(item: str or Word) -> Tuple[str, str or None]:
+        """ Get the range of the words starting with the item: [first; last).
+
+        The last symbols, which can't be increased, are dropped
+        and the previous one is increased. If there's no such one,
+        e.g. the item is empty, the range has no upper bound.
+
+        :param item: str or Word, beginning of the words.
+        :return: tuple of str, bounds of the range,
+        the last one is None if there's no upper bound.
+        """
+        if isinstance(item, Word):
+            item = item.word
+        item = comm_funcs.fmt_str(item)
+
+        stem = item.rstrip(chr(sys.maxunicode))
+        if not stem:
+            return item, None
+        return item, f"{stem[:-1]}{chr(ord(stem[-1]) + 1)}"
+
+    def contains(self,
+                 item: str or Word,
+                 prefix: bool = False) -> bool:
+        """ Check whether the word is in the database,
+        the index on the words is used.
+
+        :param item: str or Word, word to check.
+        :param prefix: bool, whether the item is the beginning of
+        the word. By default – the item is the whole word.
+        :return: bool, whether there's such word.
+        """
+        first, last = self._word_range(item)
+        if prefix and last is None:
+            found = self._cursor.execute(
+                f""" SELECT 1 FROM {self._TABLE_NAME}
+                      WHERE word >= ? LIMIT 1 """, (first,)
+            )
+        elif prefix:
+            found = self._cursor.execute(
+                f""" SELECT 1 FROM {self._TABLE_NAME}
+                      WHERE word >= ? AND word < ? LIMIT 1 """,
+                (first, last)
+            )
+        else:
+            found = self._cursor.execute(
+                f""" SELECT 1 FROM {self._TABLE_NAME}
+                      WHERE word = ? LIMIT 1 """, (first,)
+            )
+        return found.fetchone() is not None
+
+    def contains_many(self,
+                      items: Iterable[str or Word],
+                      prefix: bool = False) -> List[bool]:
+        """ Check whether the words are in the database by one query.
+
+        :param items: iterable of str or Words, words to check.
+        :param prefix: bool, whether the items are the beginnings of
+        the words. By default – the items are the whole words.
+        :return: list of bool, whether there's such word,
+        in the order of the items.
+        """
+        ranges = [self._word_range(item) for item in items]
+        condition = ("word >= json_extract(item.value, '$[0]') AND "
+                     "word < json_extract(item.value, '$[1]')"
+                     if prefix else "word = json_extract(item.value, '$[0]')")
+        # all items are one bound parameter, so there's no limit
+        found = self._cursor.execute(
+            f""" SELECT item.key FROM json_each(?) AS item
+                  WHERE EXISTS (
+                    SELECT 1 FROM {self._TABLE_NAME} WHERE {condition}) """,
+            (json.dumps(ranges),)
+        )
+        result = [False] * len(ranges)
+        for index, in found.fetchall():
+            result[index] = True
+        # 'word < NULL' is never true, the ranges
+        # without the upper bound are checked apart
+        for index, (first, last) in enumerate(ranges):
+            if prefix and last is None:
+                result[index] = self.contains(first, prefix=True)
+        return result
 
     def __contains__(self,
                      item: str or Word) -> bool:
@@ -737,15 +2035,7 @@ class Vocabulary:
         :param item: str or Word, word to check.
         :return: bool, whether the word is in the Vocabulary.
         """
-        if isinstance(item, Word):
-            item = item.word
-
-        item = comm_funcs.fmt_str(item)
-        words = self._cursor.execute(
-            f""" SELECT word FROM {self._TABLE_NAME} 
-                  WHERE word LIKE '%{item}%' """
-        )
-        return bool(words.fetchone())
+        return self.contains(item)
 
     def __len__(self) -> int:
         """
@@ -767,27 +2057,37 @@ class Vocabulary:
             raise TypeError(f"Wrong type: '{type(item)}', "
                             f"datetime.date or slice expected")
 
+        date_index = self._index('date')
         if isinstance(item, datetime.date):
-            items_at_date = filter(
-                lambda word: word.date == item,
-                self.data
-            )
+            positions = date_index.at(self._to_date(item))
         elif isinstance(item, slice):
-            start = item.start or self.begin
-            stop = item.stop or self.end
+            start, stop = item.start, item.stop
 
-            if not isinstance((start, stop), datetime.date):
+            if not all(isinstance(date, (datetime.date, type(None)))
+                       for date in (start, stop)):
                 raise TypeError(
                     f"Slice for '{type(start)}', '{type(stop)}'"
                     f" not defined, datetime.date expected")
-            if start > stop:
+            start = start and self._to_date(start)
+            stop = stop and self._to_date(stop)
+            if start and stop and start > stop:
                 raise ValueError("Start must be <= than stop")
 
-            items_at_date = filter(
-                lambda word: start <= word.date <= stop,
-                self.data
-            )
-        return list(items_at_date)
+            positions = date_index.between(start, stop)
+        return [
+            self._data[position]
+            for position in positions
+        ]
+
+    @staticmethod
+    def _to_date(item: datetime.date) -> datetime.date:
+        """
+        :param item: datetime.date or datetime.datetime.
+        :return: datetime.date without time.
+        """
+        if isinstance(item, datetime.datetime):
+            return item.date()
+        return item
 
     def __call__(self,
                  item: str or Word) -> List[Word]:
@@ -840,9 +2140,7 @@ class Vocabulary:
         return hash(self.data)
 
 
-# TODO: как сказать по-английски?
-#  как сказать по-русски?
-#  ряд синонимов,
+# TODO: ряд синонимов,
 #  ряд антонимов,
 #  полные предложения без перевода,
 #  предложения без запоминаемой лексемы с переводом,
@@ -0,0 +1,39 @@
+import datetime
+import sqlite3
+
+import pytest
+
+from src.words.words import Vocabulary, Word
+
+
+DATE = datetime.date(2020, 6, 1)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / 'Vocabulary.db'
+    db = sqlite3.connect(path)
+    db.execute(
+        """ CREATE TABLE Vocabulary (id TEXT, date TEXT, word TEXT,
+        properties TEXT, transcription TEXT, English TEXT, Russian TEXT) """
+    )
+    words = [
+        Word('get', DATE, 'b1, verb', 'to obtain', 'получать'),
+        Word('forget', DATE, 'b1, verb', 'to fail to remember', 'забывать'),
+        Word('target', DATE + datetime.timedelta(days=2), 'b2, noun',
+             'a goal', 'цель'),
+    ]
+    db.executemany(
+        """ INSERT INTO Vocabulary (id, date, word, properties,
+        transcription, English, Russian) VALUES (:id, :date, :word,
+        :properties, '', :English, :Russian) """,
+        [word.fields for word in words]
+    )
+    db.commit()
+    db.close()
+    return path
+
+
+@pytest.fixture
+def vocabulary(db_path):
+    return Vocabulary(db_path)
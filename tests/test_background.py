@@ -0,0 +1,136 @@
+import asyncio
+import threading
+
+import pytest
+
+from tests.conftest import DATE
+from src.main.background import AsyncVocabulary
+from src.words.words import Word
+
+
+@pytest.fixture
+def facade(vocabulary):
+    facade = AsyncVocabulary(vocabulary)
+    yield facade
+    facade.shutdown()
+
+
+def block(facade):
+    """ Occupy the worker thread until the event is set """
+    started, release = threading.Event(), threading.Event()
+
+    def wait():
+        started.set()
+        release.wait(5)
+
+    facade._submit(wait)
+    started.wait(5)
+    return release
+
+
+def test_indexes_are_built_in_background(vocabulary):
+    facade = AsyncVocabulary(vocabulary)
+    facade.statistics().result(5)
+    facade.shutdown()
+    assert 'fuzzy' in vocabulary._indexes
+
+    vocabulary._indexes.clear()
+    facade = AsyncVocabulary(vocabulary, indexes=())
+    facade.statistics().result(5)
+    facade.shutdown()
+    assert 'fuzzy' not in vocabulary._indexes
+
+
+def test_search(facade, vocabulary):
+    assert facade.search('get').result(5) == vocabulary.search('get')
+    assert facade.search_by_properties('b2').result(5) == \
+           vocabulary.search_by_properties('b2')
+    assert facade.fuzzy_search('forgt', limit=1).result(5) == \
+           vocabulary.fuzzy_search('forgt', limit=1)
+    assert facade.search_definitions('goal').result(5) == \
+           vocabulary.search_definitions('goal')
+
+
+def test_search_error(facade):
+    with pytest.raises(TypeError):
+        facade.search(42).result(5)
+
+
+def test_new_search_cancels_pending(facade, vocabulary):
+    release = block(facade)
+    first = facade.search('get')
+    other = facade.search_by_properties('b1')
+    last = facade.search('target')
+    release.set()
+
+    assert first.cancelled()
+    assert other.result(5) == vocabulary.search_by_properties('b1')
+    assert last.result(5) == vocabulary.search('target')
+
+
+def test_new_search_cancels_running(facade, vocabulary, monkeypatch):
+    started, release = threading.Event(), threading.Event()
+    search = vocabulary.search
+
+    def slow_search(item):
+        started.set()
+        release.wait(5)
+        return search(item)
+
+    monkeypatch.setattr(type(vocabulary), 'search',
+                        lambda self, item: slow_search(item))
+    first = facade.search('get')
+    started.wait(5)
+    last = facade.search('target')
+    release.set()
+
+    assert last.result(5) == search('target')
+    assert first.cancelled()
+
+
+def test_running_extend_is_not_cancelled(facade, vocabulary, monkeypatch):
+    started, release = threading.Event(), threading.Event()
+    extend = vocabulary.extend
+
+    def slow_extend(items, **kwargs):
+        started.set()
+        release.wait(5)
+        return extend(items, **kwargs)
+
+    monkeypatch.setattr(type(vocabulary), 'extend',
+                        lambda self, items, **kwargs: slow_extend(items))
+    written = facade.extend([Word('budget', DATE, 'b2')])
+    started.wait(5)
+
+    assert not written.cancel()
+    release.set()
+    assert written.result(5) is None
+    assert len(vocabulary) == 4
+
+
+def test_pending_extend_is_cancelled(facade, vocabulary):
+    release = block(facade)
+    written = facade.extend([Word('budget', DATE, 'b2')])
+
+    assert written.cancel()
+    release.set()
+    assert facade.statistics().result(5)
+    assert len(vocabulary) == 3
+
+
+def test_extend_then_statistics(facade, vocabulary):
+    items = [Word('budget', DATE, 'b2', 'money plan')]
+    written = facade.extend(items)
+    items.clear()
+    statistics = facade.statistics()
+
+    assert written.result(5) is None
+    assert "Total: 4\n" in statistics.result(5)
+    assert len(vocabulary) == 4
+
+
+def test_await(facade, vocabulary):
+    async def search():
+        return await asyncio.wrap_future(facade.search('forget'))
+
+    assert asyncio.run(search()) == vocabulary.search('forget')
@@ -0,0 +1,93 @@
+import sqlite3
+import threading
+
+import pytest
+
+from src.main.connection import ConnectionManager, get_manager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = ConnectionManager(tmp_path / 'test.db')
+    manager.execute("CREATE TABLE items (value INTEGER)")
+    manager.connection.commit()
+    yield manager
+    manager.close()
+
+
+def in_thread(func):
+    result = []
+    thread = threading.Thread(target=lambda: result.append(func()))
+    thread.start()
+    thread.join()
+    return result[0]
+
+
+def test_pragmas(manager):
+    pragmas = {
+        pragma: manager.execute(f"PRAGMA {pragma}").fetchone()[0]
+        for pragma in ('journal_mode', 'synchronous', 'busy_timeout')
+    }
+
+    assert pragmas == {'journal_mode': 'wal', 'synchronous': 1,
+                       'busy_timeout': 5000}
+
+
+def test_connection_per_thread(manager):
+    assert manager.connection is manager.connection
+    assert manager.cursor.connection is manager.connection
+    assert in_thread(lambda: manager.connection) is not manager.connection
+
+
+def test_functions_in_all_threads(manager):
+    manager.connection
+    manager.create_function('twice', 1, lambda value: value * 2)
+
+    assert manager.execute("SELECT twice(2)").fetchone() == (4,)
+    assert in_thread(
+        lambda: manager.execute("SELECT twice(3)").fetchone()) == (6,)
+
+
+def test_reader_does_not_block_writer(manager):
+    manager.execute("INSERT INTO items VALUES (1)")
+    manager.connection.commit()
+    reading, written = threading.Event(), threading.Event()
+
+    def read():
+        db = manager.connection
+        db.execute("BEGIN")
+        first = db.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        reading.set()
+        written.wait(5)
+        # the read transaction sees its snapshot
+        second = db.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        db.rollback()
+        return first, second
+
+    result = []
+    reader = threading.Thread(target=lambda: result.append(read()))
+    reader.start()
+    reading.wait(5)
+    with manager.connection:
+        manager.execute("INSERT INTO items VALUES (2)")
+    written.set()
+    reader.join()
+
+    assert result == [(1, 1)]
+    assert manager.execute("SELECT COUNT(*) FROM items").fetchone() == (2,)
+
+
+def test_close(manager):
+    db = manager.connection
+    manager.close()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        db.execute("SELECT 1")
+    assert manager.execute("SELECT COUNT(*) FROM items").fetchone() == (0,)
+
+
+def test_get_manager_is_shared(tmp_path):
+    assert get_manager(tmp_path / 'test.db') is \
+           get_manager(tmp_path / '.' / 'test.db')
+    assert get_manager(tmp_path / 'test.db') is not \
+           get_manager(tmp_path / 'other.db')
@@ -0,0 +1,56 @@
+import datetime
+
+import pytest
+
+from tests.conftest import DATE
+from src.words.words import Word
+
+np = pytest.importorskip('numpy')
+
+
+@pytest.fixture
+def frame(vocabulary):
+    vocabulary.append(Word('budget', DATE + datetime.timedelta(days=2), 'b2'))
+    return vocabulary.frame()
+
+
+def test_len(frame, vocabulary):
+    assert len(frame) == len(vocabulary) == 4
+
+
+def test_statistics_as_vocabulary(frame, vocabulary):
+    assert frame.dynamic() == vocabulary.dynamic()
+    assert frame.duration() == vocabulary.duration
+    assert frame.empty_days_count() == vocabulary.empty_days_count()
+    assert frame.avg_count_of_words() == vocabulary.avg_count_of_words()
+    assert frame.max_day_info() == vocabulary.max_day_info()
+    assert frame.min_day_info() == vocabulary.min_day_info()
+
+
+def test_between(frame, vocabulary):
+    second_day = DATE + datetime.timedelta(days=1)
+
+    assert frame.between(DATE, second_day).tolist() == [0, 1]
+    assert frame.between(second_day).tolist() == [2, 3]
+    assert frame.between().tolist() == list(range(len(vocabulary)))
+
+
+def test_with_properties(frame, vocabulary):
+    assert frame.with_properties('b2').tolist() == [2, 3]
+    assert frame.with_properties('b1', 'verb').tolist() == [0, 1]
+    assert frame.with_properties('b2', 'verb').tolist() == []
+    assert frame.with_properties('c2').tolist() == []
+    assert frame.properties_count() == vocabulary.properties_count()
+
+
+def test_with_ids(frame, vocabulary):
+    ids = vocabulary.data[3].id, vocabulary.data[0].id
+
+    assert frame.with_ids(*ids).tolist() == [0, 3]
+
+
+def test_frame_rebuilt_after_append(frame, vocabulary):
+    vocabulary.append(Word('widget', DATE))
+
+    assert vocabulary.frame() is not frame
+    assert len(vocabulary.frame()) == 5
@@ -0,0 +1,55 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+# max cumulative import time of the package, μs
+IMPORT_BUDGET = 250_000
+# they must be imported only by the features which need them
+HEAVY_MODULES = {
+    'xlrd', 'docx', 'xlsxwriter', 'aiohttp', 'asyncio',
+    'PyQt5', 'rnc', 'numpy',
+}
+
+
+def import_times(statement):
+    """ Import times of all modules imported by the statement.
+
+    :return: dict of str and int, module – its cumulative time in μs.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module = line.split('|')
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize('statement, package', [
+    ('from src.words import Vocabulary', 'src.words'),
+    ('import src.docs', 'src.docs'),
+    ('import src.repeat', 'src.repeat'),
+    ('import src.main.common_funcs', 'src.main.common_funcs'),
+])
+def test_heavy_modules_are_lazy(statement, package):
+    times = import_times(statement)
+
+    assert package in times
+    assert not HEAVY_MODULES & set(times)
+
+
+def test_import_budget():
+    # the least of several runs, others might be slowed down by the system
+    spent = min(
+        import_times('from src.words import Vocabulary')['src.words']
+        for _ in range(3)
+    )
+
+    assert spent < IMPORT_BUDGET
@@ -0,0 +1,69 @@
+import pytest
+
+import src.main.common_funcs as comm_funcs
+from tests.conftest import DATE
+from src.words.importer import import_cambridge_tables
+from src.words.words import Vocabulary
+
+xlsxwriter = pytest.importorskip('xlsxwriter')
+
+
+def write_table(path, rows):
+    book = xlsxwriter.Workbook(str(path))
+    sheet = book.add_worksheet()
+    # the first row is empty, the second one is the header
+    sheet.write_row(1, 0, ['Word', 'Properties', 'English', 'Russian'])
+    for num, row in enumerate(rows, 2):
+        sheet.write_row(num, 0, row)
+    book.close()
+
+
+@pytest.fixture
+def folder(tmp_path):
+    folder = tmp_path / 'xlsx'
+    folder.mkdir()
+    write_table(folder / 'first.xlsx', [
+        ['get', 'b1, verb', 'to obtain', 'получать'],
+        ['budget', 'b2', 'money plan', 'бюджет'],
+    ])
+    write_table(folder / 'second.xlsx', [
+        ['budget', 'b2', 'money plan', 'бюджет'],
+        ['budget', 'b2', 'to plan money', 'планировать'],
+        ['widget', '', 'a small gadget', 'виджет'],
+    ])
+    # the dynamic of learning isn't imported
+    write_table(folder / 'info_01.06.2020-03.06.2020.xlsx', [
+        ['gadget', '', 'a device', 'прибор'],
+    ])
+    return folder
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_import(vocabulary, db_path, folder, workers):
+    timings = import_cambridge_tables(vocabulary, folder, workers, DATE)
+
+    assert set(timings) == {'parse', 'merge', 'dedup', 'write', 'total'}
+    assert [word.word for word in vocabulary] == \
+           ['get', 'forget', 'target', 'budget', 'widget']
+    assert vocabulary.data[3].english == ['money plan', 'to plan money']
+    assert len(Vocabulary(db_path)) == 5
+
+
+def test_import_bypasses_word_id_memo(vocabulary, folder):
+    comm_funcs.word_id.cache_clear()
+    import_cambridge_tables(vocabulary, folder, workers=1, date=DATE)
+
+    assert comm_funcs.word_id.cache_info().currsize == 0
+    assert vocabulary.has_id(comm_funcs.word_id('budget'))
+
+
+def test_import_twice(vocabulary, folder):
+    import_cambridge_tables(vocabulary, folder, date=DATE)
+    import_cambridge_tables(vocabulary, folder, date=DATE)
+
+    assert len(vocabulary) == 5
+
+
+def test_import_wrong_folder(vocabulary, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        import_cambridge_tables(vocabulary, tmp_path / 'wrong')
@@ -0,0 +1,818 @@
+import datetime
+import sqlite3
+import sys
+import tracemalloc
+from collections.abc import Sequence
+
+import pytest
+
+import src.main.common_funcs as comm_funcs
+import src.words.indexes as indexes
+from src.words.words import (
+    Vocabulary, Word, SnapshotWords, parse_cambridge_xlsx
+)
+from tests.conftest import DATE
+
+
+def test_append_updates_data(vocabulary):
+    vocabulary.append(Word('gadget', DATE, 'c1', 'a device', 'прибор'))
+
+    assert len(vocabulary) == 4
+    assert vocabulary.data[-1].word == 'gadget'
+
+
+def test_extend_equals_reload(vocabulary, db_path):
+    vocabulary.extend([
+        Word('budget', DATE, 'b2, noun', 'money plan', 'бюджет'),
+        Word('widget', DATE, 'c1', 'a small gadget', 'виджет'),
+    ])
+
+    reloaded = Vocabulary(db_path)
+    assert [str(word) for word in vocabulary] == \
+           [str(word) for word in reloaded]
+    assert [word.date for word in vocabulary] == \
+           [word.date for word in reloaded]
+
+
+def test_word_date_is_date():
+    word = Word('get', datetime.datetime(2020, 6, 1, 12, 30))
+    assert type(word.date) is datetime.date
+
+
+def test_extend_ignore_duplicates(vocabulary, db_path):
+    vocabulary.extend([
+        Word('get', DATE, 'c1', 'to receive', 'получить'),
+        Word('budget', DATE, 'b2', 'money plan', 'бюджет'),
+        Word('budget', DATE, 'b2', 'money plan', 'бюджет'),
+    ], on_conflict='ignore')
+
+    assert len(vocabulary) == len(Vocabulary(db_path)) == 4
+    assert vocabulary.data[0].english == ['to obtain']
+
+
+def test_extend_replace_duplicates(vocabulary, db_path):
+    vocabulary.extend([
+        Word('get', DATE, 'c1', 'to receive', 'получить')
+    ], on_conflict='replace')
+
+    reloaded = Vocabulary(db_path)
+    assert len(vocabulary) == len(reloaded) == 3
+    assert vocabulary.data[0].english == reloaded.data[0].english == \
+           ['to receive']
+
+
+@pytest.mark.parametrize('on_conflict, english', [
+    ('ignore', ['a sum']), ('replace', ['money plan']),
+])
+def test_extend_conflict_with_other_writer(vocabulary, db_path, monkeypatch,
+                                           on_conflict, english):
+    existing_ids = type(vocabulary)._existing_ids
+
+    def write_between(self, ids):
+        found = existing_ids(self, ids)
+        # other connection writes the id after the check
+        with sqlite3.connect(db_path) as db:
+            db.execute(
+                """ INSERT INTO Vocabulary (id, date, word, properties,
+                transcription, English, Russian) VALUES (:id, :date, :word,
+                :properties, '', :English, :Russian) """,
+                Word('budget', DATE, 'b2', 'a sum').fields
+            )
+        return found
+
+    monkeypatch.setattr(type(vocabulary), '_existing_ids', write_between)
+    vocabulary.extend([Word('budget', DATE, 'b2', 'money plan')],
+                      on_conflict=on_conflict)
+
+    budget = Vocabulary(db_path, snapshot=False).search_by_id(
+        comm_funcs.word_id('budget'))
+    assert [word.english for word in budget] == [english]
+
+
+def test_extend_commits_by_chunks(vocabulary, db_path):
+    words = [Word('budget'), Word('widget'), 'gadget']
+    with pytest.raises(TypeError):
+        vocabulary.extend(words, chunk_size=2)
+
+    assert len(vocabulary) == len(Vocabulary(db_path)) == 5
+
+
+def test_extend_wrong_conflict_policy(vocabulary):
+    with pytest.raises(ValueError):
+        vocabulary.extend([Word('budget')], on_conflict='update')
+
+
+def test_search_by_id_keeps_order(vocabulary):
+    target, get = vocabulary.data[2], vocabulary.data[0]
+
+    assert vocabulary.search_by_id(target.id, 'wrong', get.id, target.id) == \
+           [target, get]
+
+
+def test_search_by_id_after_replace(vocabulary):
+    word = Word('get', DATE, 'c1', 'to receive', 'получить')
+    vocabulary.search_by_id(word.id)
+    vocabulary.extend([word, Word('budget')], on_conflict='replace')
+
+    assert vocabulary.search_by_id(word.id)[0].english == ['to receive']
+    assert vocabulary.search_by_id(Word('budget').id) == [Word('budget')]
+
+
+@pytest.mark.parametrize('item', ['get', 'ge', 't', '', 'forgetful', 'arg', 'z'])
+def test_search_as_scan(vocabulary, item):
+    vocabulary.append(Word('a'))
+    expected = [
+        word for word in vocabulary
+        if item in word.word or word.word in item
+    ]
+    assert vocabulary.search(item) == expected
+
+
+@pytest.mark.parametrize('item, expected', [
+    ('forgt', ['forget']), ('gte', ['get']), ('Targett ', ['target']),
+    ('orget', ['forget', 'get', 'target']), ('budget', []),
+])
+def test_fuzzy_search(vocabulary, item, expected):
+    assert [word.word for word in vocabulary.fuzzy_search(item)] == expected
+
+
+def test_fuzzy_search_limit_and_distance(vocabulary):
+    forget = vocabulary.data[1]
+    assert vocabulary.fuzzy_search('orget', limit=1) == [forget]
+    assert vocabulary.fuzzy_search('orget', max_distance=1) == [forget]
+    with pytest.raises(ValueError):
+        vocabulary.fuzzy_search('gets', max_distance=3)
+
+
+def test_fuzzy_search_as_scan(vocabulary):
+    vocabulary.extend([Word(item) for item in (
+        'budget', 'widget', 'gadget', 'fidget', 'forge', 'forgery', 'tar',
+        'argent', 'garget', 'gate', 'great', 'egret', 'ogre')])
+    distance = indexes.FuzzyIndex.distance
+
+    for item in ('fudget', 'forgetable', 'gret', 'tagret', 'ger', 'xyz'):
+        scan = sorted(
+            (distance(item, word.word, 2), word.word)
+            for word in vocabulary
+            if distance(item, word.word, 2) <= 2
+        )
+        assert [word.word for word in vocabulary.fuzzy_search(item, 2, 5)] \
+               == [word for _, word in scan[:5]]
+
+
+def test_fuzzy_search_after_extend(vocabulary):
+    vocabulary.fuzzy_search('budgt')
+    vocabulary.extend([Word('budget')])
+    vocabulary.extend([Word('get', DATE, 'c1')], on_conflict='replace')
+
+    assert [word.word for word in vocabulary.fuzzy_search('budgt')] == \
+           ['budget']
+    assert vocabulary.fuzzy_search('gt')[0].properties == ['c1']
+
+
+def test_fuzzy_index_merges_added_words(monkeypatch):
+    monkeypatch.setattr(indexes.FuzzyIndex, 'MERGE_SIZE', 64)
+    built = [Word(f"{letter}{number}get") for letter in 'abcdefghij'
+             for number in range(10)]
+    added = [Word(f"{letter}{number}set") for letter in 'abcdefghij'
+             for number in range(30)]
+    index = indexes.FuzzyIndex()
+    index.build(built)
+    built_keys = len(index._keys)
+    for position, word in enumerate(added, len(built)):
+        index.add(position, word)
+    index.discard(len(built), added[0])
+
+    # the deletions of the added words have been merged to the array
+    assert len(index._keys) > built_keys
+    assert list(index._keys) == sorted(index._keys)
+    assert len(index) == len(built) + len(added)
+    assert index.search('b1sed', 1, 5) == [(1, 'b1set', [131])]
+    assert index.search('a0get', 0, 5) == [(0, 'a0get', [0])]
+    assert index.search('a0set', 0, 5) == []
+
+
+def test_build_indexes(db_path):
+    lazy = Vocabulary(db_path, lazy=True)
+    lazy.build_indexes('fuzzy', 'sorted')
+
+    assert sorted(lazy._indexes) == ['fuzzy', 'sorted']
+    assert [word.word for word in lazy.fuzzy_search('forgt')] == ['forget']
+    with pytest.raises(ValueError):
+        lazy.build_indexes('wrong')
+
+    vocabulary = Vocabulary(db_path)
+    vocabulary.build_indexes()
+    assert sorted(vocabulary._indexes) == sorted(Vocabulary._INDEXES)
+
+
+def test_search_after_extend(vocabulary):
+    vocabulary.search('get')
+    vocabulary.extend([Word('gadget'), Word('get', DATE, 'c1')],
+                      on_conflict='replace')
+
+    assert [word.word for word in vocabulary('adge')] == ['gadget']
+    assert [word.word for word in vocabulary('get')] == \
+           ['get', 'forget', 'target', 'gadget']
+
+
+@pytest.mark.parametrize('properties', [
+    ('b1',), ('B1 ', 'verb'), ('b2', 'verb'), ('noun',), ('c2',), ()])
+def test_search_by_properties_as_scan(vocabulary, properties):
+    expected = [
+        word for word in vocabulary
+        if word.is_fit(*properties)
+    ]
+    assert vocabulary.search_by_properties(*properties) == expected
+    assert vocabulary.count_by_properties(*properties) == len(expected)
+
+
+def test_properties_count(vocabulary):
+    vocabulary.properties_count()
+    vocabulary.extend([Word('get', DATE, 'c1, verb'), Word('budget', DATE, 'b2')],
+                      on_conflict='replace')
+
+    assert vocabulary.properties_count() == {
+        'b1': 1, 'b2': 2, 'c1': 1, 'noun': 1, 'verb': 2}
+
+
+def test_getitem_date(vocabulary):
+    assert [word.word for word in vocabulary[DATE]] == ['get', 'forget']
+    assert vocabulary[DATE + datetime.timedelta(days=1)] == []
+
+
+def test_getitem_slice(vocabulary):
+    vocabulary.append(Word('budget', DATE - datetime.timedelta(days=1)))
+    second_day = DATE + datetime.timedelta(days=1)
+
+    assert [word.word for word in vocabulary[DATE:second_day]] == \
+           ['get', 'forget']
+    assert [word.word for word in vocabulary[second_day:]] == ['target']
+    assert len(vocabulary[:]) == 4
+    with pytest.raises(ValueError):
+        vocabulary[second_day:DATE]
+
+
+def test_get_item_before_now(vocabulary):
+    vocabulary.get_date_list()
+    vocabulary.append(Word('budget', DATE - datetime.timedelta(days=1)))
+
+    assert vocabulary.get_date_list() == [
+        DATE - datetime.timedelta(days=1), DATE,
+        DATE + datetime.timedelta(days=2)]
+    assert [word.word for word in vocabulary.get_item_before_now(0)] == \
+           ['target']
+    assert [word.word for word in vocabulary.get_item_before_now(2)] == \
+           ['budget']
+    with pytest.raises(ValueError):
+        vocabulary.get_item_before_now(3)
+
+
+def test_statistics(vocabulary):
+    assert vocabulary.dynamic() == {
+        DATE: 2, DATE + datetime.timedelta(days=2): 1}
+    assert vocabulary.empty_days_count() == 1
+    assert vocabulary.avg_count_of_words() == 1
+    assert vocabulary.max_day_info() == (DATE, 2)
+    assert vocabulary.statistics() == \
+           "Duration: 3 days\n" \
+           "Average amount of learned words: 1\n" \
+           "Empty days: 1\n" \
+           "Total: 3\n" \
+           "Would be total: 4\n" \
+           "Max day: 01.06.2020 = 2\n" \
+           "Min day: 03.06.2020 = 1"
+
+
+def test_statistics_after_append(vocabulary):
+    vocabulary.statistics()
+    vocabulary.extend([Word('budget', DATE + datetime.timedelta(days=3)),
+                       Word('widget', DATE + datetime.timedelta(days=3))])
+
+    assert vocabulary.dynamic()[DATE + datetime.timedelta(days=3)] == 2
+    assert vocabulary.statistics().startswith("Duration: 4 days\n")
+    assert "Total: 5\n" in vocabulary.statistics()
+
+
+def test_migration(vocabulary, db_path):
+    db = sqlite3.connect(db_path)
+    version = db.execute("PRAGMA user_version").fetchone()[0]
+    plan = db.execute(
+        """ EXPLAIN QUERY PLAN SELECT MIN(date) FROM Vocabulary """
+    ).fetchall()
+
+    assert version == len(Vocabulary._MIGRATIONS)
+    assert 'Vocabulary_date' in str(plan)
+    assert vocabulary.begin == DATE
+    assert vocabulary.end == DATE + datetime.timedelta(days=2)
+
+
+def test_migration_merges_duplicate_ids(db_path):
+    db = sqlite3.connect(db_path)
+    db.execute(
+        """ INSERT INTO Vocabulary (id, date, word, properties,
+        transcription, English, Russian) VALUES (?, ?, 'get', '[noun]',
+        '', 'to obtain; offspring', 'потомство') """,
+        (comm_funcs.word_id('get'), DATE - datetime.timedelta(days=1))
+    )
+    db.commit()
+    db.close()
+
+    vocabulary = Vocabulary(db_path)
+    get = vocabulary.search_by_id(comm_funcs.word_id('get'))
+
+    assert len(vocabulary) == 3
+    assert len(get) == 1
+    assert get[0].date == DATE - datetime.timedelta(days=1)
+    assert get[0].properties == ['b1', 'noun', 'verb']
+    assert get[0].english == ['to obtain', 'offspring']
+    with pytest.raises(sqlite3.IntegrityError):
+        vocabulary.extend([Word('get')])
+
+
+def test_migration_normalizes_duplicate_words(db_path):
+    with sqlite3.connect(db_path) as db:
+        db.execute(
+            """ INSERT INTO Vocabulary (id, date, word, properties,
+            transcription, English, Russian) VALUES (?, ?, 'Get ', '[noun]',
+            '', 'offspring', '') """, (comm_funcs.word_id('get'), DATE)
+        )
+
+    get = Vocabulary(db_path).search_by_id(comm_funcs.word_id('get'))
+
+    assert [(word.word, word.properties) for word in get] == \
+           [('get', ['b1', 'noun', 'verb'])]
+
+
+def test_failed_migration_is_rolled_back(db_path):
+    with sqlite3.connect(db_path) as db:
+        db.execute(
+            """ INSERT INTO Vocabulary (id, date, word, properties,
+            transcription, English, Russian) VALUES (?, 'wrong date', 'get',
+            '', '', '', '') """, (comm_funcs.word_id('get'),)
+        )
+
+    for _ in range(2):
+        # the same error, no transaction is left open
+        with pytest.raises(ValueError):
+            Vocabulary(db_path)
+    with sqlite3.connect(db_path) as db:
+        assert db.execute("PRAGMA user_version").fetchone()[0] == 1
+        assert db.execute("SELECT COUNT(*) FROM Vocabulary").fetchone() == (4,)
+
+
+def test_extend_merges_same_ids(vocabulary, db_path):
+    vocabulary.extend([
+        Word('run', DATE + datetime.timedelta(days=1), 'verb', 'to move fast'),
+        Word('budget'),
+        Word('run', DATE, 'noun', 'an act of running', 'бег'),
+    ])
+
+    run = vocabulary.search_by_id(comm_funcs.word_id('run'))
+    # the merge is lossy: the senses share the properties and the defs
+    assert [repr(word) for word in run] == [
+        repr(Word('run', DATE, 'noun, verb',
+                  'to move fast; an act of running', 'бег'))]
+    assert [str(word) for word in vocabulary] == \
+           [str(word) for word in Vocabulary(db_path)]
+    assert len(vocabulary) == 5
+
+
+def test_extend_duplicate_id_fails(vocabulary, db_path):
+    with pytest.raises(sqlite3.IntegrityError):
+        vocabulary.extend([Word('budget'), Word('get', DATE, 'c1')])
+
+    assert len(vocabulary) == 3
+    assert len(Vocabulary(db_path)) == 3
+
+
+def test_extend_merge_duplicates(vocabulary, db_path):
+    vocabulary.extend([
+        Word('get', DATE + datetime.timedelta(days=1), 'noun, b1',
+             'offspring; to obtain', 'потомство'),
+        Word('budget', DATE, 'b2', 'money plan'),
+        Word('budget', DATE, 'noun', 'money plan; a sum', 'бюджет'),
+    ], on_conflict='merge')
+
+    get = vocabulary.search_by_id(comm_funcs.word_id('get'))[0]
+    assert get.date == DATE
+    assert get.properties == ['b1', 'noun', 'verb']
+    assert get.english == ['to obtain', 'offspring']
+    assert get.russian == ['получать', 'потомство']
+
+    reloaded = Vocabulary(db_path)
+    assert len(vocabulary) == len(reloaded) == 4
+    assert [str(word) for word in vocabulary] == \
+           [str(word) for word in reloaded]
+
+
+@pytest.mark.parametrize('item, language, expected', [
+    ('remember', None, ['forget']), ('to', 'English', ['forget', 'get']),
+    ('ЦЕЛЬ', 'Russian', ['target']), ('цель', 'English', []),
+    ('obt', None, ['get']), ('a "goal', None, ['target']),
+    ('goal OR get*', None, []),
+    ('to fail', None, ['forget']), ('?!', None, []),
+])
+def test_search_definitions(vocabulary, item, language, expected):
+    found = vocabulary.search_definitions(item, language)
+    assert [word.word for word in found] == expected
+
+
+def test_search_definitions_wrong_language(vocabulary):
+    with pytest.raises(ValueError):
+        vocabulary.search_definitions('goal', 'German')
+
+
+def test_say_in_english_after_extend(vocabulary):
+    vocabulary.extend([
+        Word('budget', DATE, 'noun', 'money plan', 'бюджет; план'),
+        Word('target', DATE, 'noun', 'a goal', 'мишень'),
+    ], on_conflict='replace')
+
+    assert vocabulary.say_in_english('план') == [vocabulary.data[3]]
+    assert vocabulary.say_in_english('цель') == []
+    assert [word.word for word in vocabulary.say_in_english('мишень')] == \
+           ['target']
+    assert [word.word for word in vocabulary.say_in_russian('plan')] == \
+           ['budget']
+
+
+@pytest.mark.parametrize('item, prefix, expected', [
+    ('get', False, True), (' Forget', False, True), ('ge', False, False),
+    ('getting', False, False), ('ge', True, True), ('targ', True, True),
+    ('get', True, True), ('gets', True, False), ('', True, True),
+    ("one's", False, False), ("one'", True, False),
+])
+def test_contains(vocabulary, item, prefix, expected):
+    assert vocabulary.contains(item, prefix) is expected
+
+
+def test_contains_word(vocabulary):
+    assert Word('target') in vocabulary
+    assert 'arg' not in vocabulary
+
+    vocabulary.append(Word("one's", DATE))
+    assert "one's" in vocabulary
+    assert vocabulary.contains("one'", prefix=True)
+
+
+def test_contains_many(vocabulary):
+    items = ['get', 'ge', 'budget', Word('target'), "one's"] * 500
+
+    assert vocabulary.contains_many(items) == \
+           [vocabulary.contains(item) for item in items]
+    assert vocabulary.contains_many(items, prefix=True) == \
+           [vocabulary.contains(item, True) for item in items]
+    assert vocabulary.contains_many([]) == []
+
+
+def test_contains_max_code_point(vocabulary):
+    top = chr(sys.maxunicode)
+    vocabulary.extend([Word(f"a{top}{top}b"), Word(top * 2)])
+    items = [top, f"a{top}", f"a{top}{top}", 'a', f"b{top}", top * 3, '']
+
+    assert [vocabulary.contains(item, prefix=True) for item in items] == \
+           [True, True, True, True, False, False, True]
+    assert vocabulary.contains_many(items, prefix=True) == \
+           [vocabulary.contains(item, True) for item in items]
+    assert vocabulary.contains(top * 2)
+
+
+def test_contains_uses_index(vocabulary, db_path):
+    db = sqlite3.connect(db_path)
+    plan = db.execute(
+        """ EXPLAIN QUERY PLAN SELECT 1 FROM Vocabulary
+             WHERE word >= ? AND word < ? """, ('get', 'geu')
+    ).fetchall()
+
+    assert 'INDEX Vocabulary_word' in str(plan)
+
+
+def test_snapshot(vocabulary, db_path):
+    cold = Vocabulary(db_path, snapshot=True)
+    loaded = Vocabulary(db_path, snapshot=True)
+
+    # the data list doesn't depend on whether the snapshot was fresh
+    assert isinstance(cold.data, SnapshotWords)
+    assert isinstance(loaded.data, SnapshotWords)
+    assert isinstance(Vocabulary(db_path).data, list)
+    assert [repr(word) for word in loaded] == \
+           [repr(word) for word in vocabulary]
+    assert [word.date for word in loaded] == \
+           [word.date for word in vocabulary]
+    assert loaded.data[-1].properties == ['b2', 'noun']
+    assert loaded.data[0].english == ['to obtain']
+    assert loaded.data[0] is loaded.data[-3]
+
+
+def test_snapshot_is_opt_in(vocabulary, db_path):
+    assert not vocabulary.snapshot_path.exists()
+    Vocabulary(db_path, snapshot=True)
+
+    assert vocabulary.snapshot_path.exists()
+    assert isinstance(Vocabulary(db_path).data, list)
+    assert Vocabulary(db_path).data + [Word('budget')]
+
+
+def test_snapshot_is_sequence(vocabulary, db_path):
+    loaded = Vocabulary(db_path, snapshot=True)
+    lazy = Vocabulary(db_path, lazy=True)
+
+    for data in (loaded.data, lazy.data):
+        assert isinstance(data, Sequence)
+        assert data.index(data[1]) == 1
+        assert data.count(data[2]) == 1
+        assert data[0] in data
+        assert [word.word for word in reversed(data)] == \
+               ['target', 'forget', 'get']
+        assert [word.word for word in list(data) + [Word('budget')]] == \
+               ['get', 'forget', 'target', 'budget']
+
+
+def reloads_snapshot(vocabulary, db_path):
+    """ Whether the broken snapshot is rejected and written again """
+    loaded = Vocabulary(db_path, snapshot=True)
+    return isinstance(loaded.data, SnapshotWords) and \
+        [repr(word) for word in loaded] == [repr(word) for word in vocabulary]
+
+
+def test_truncated_snapshot(vocabulary, db_path):
+    vocabulary.save_snapshot()
+    content = vocabulary.snapshot_path.read_bytes()
+    assert len(content) > 60
+    for length in (0, 40, 60, len(content) - 1):
+        vocabulary.snapshot_path.write_bytes(content[:length])
+        assert reloads_snapshot(vocabulary, db_path)
+
+    vocabulary.snapshot_path.write_bytes(content + b'\0')
+    assert reloads_snapshot(vocabulary, db_path)
+    assert vocabulary.snapshot_path.read_bytes() != content + b'\0'
+
+
+def test_snapshot_is_stale_after_write(vocabulary, db_path):
+    Vocabulary(db_path, snapshot=True)
+    vocabulary.extend([Word('budget', DATE, 'b2', 'money plan', 'бюджет')])
+
+    assert reloads_snapshot(vocabulary, db_path)
+    assert len(vocabulary) == 4
+
+
+def test_snapshot_extend(vocabulary, db_path):
+    loaded = Vocabulary(db_path, snapshot=True)
+    loaded.search('get')
+    loaded.extend([Word('budget')])
+    loaded.extend([Word('get', DATE, 'c1')], on_conflict='replace')
+
+    assert [word.word for word in loaded.search('get')] == \
+           ['get', 'forget', 'target', 'budget']
+    assert loaded.data[0].properties == ['c1']
+    assert [str(word) for word in loaded] == \
+           [str(word) for word in Vocabulary(db_path)]
+
+
+@pytest.mark.parametrize('content', [b'', b'VOCS', b'broken' * 100])
+def test_broken_snapshot(vocabulary, db_path, content):
+    vocabulary.snapshot_path.write_bytes(content)
+
+    assert reloads_snapshot(vocabulary, db_path)
+    assert vocabulary.snapshot_path.read_bytes() != content
+
+
+def test_lazy_vocabulary(vocabulary, db_path):
+    lazy = Vocabulary(db_path, lazy=True)
+
+    assert len(lazy) == len(vocabulary)
+    assert [str(word) for word in lazy] == [str(word) for word in vocabulary]
+    assert str(lazy.data[-1]) == str(vocabulary.data[2])
+    assert [word.word for word in lazy.data[1:]] == ['forget', 'target']
+    assert [word.word for word in lazy.search('get')] == \
+           ['get', 'forget', 'target']
+    assert [word.word for word in lazy[DATE]] == ['get', 'forget']
+    with pytest.raises(IndexError):
+        lazy.data[3]
+
+
+def test_lazy_vocabulary_extend(db_path):
+    lazy = Vocabulary(db_path, lazy=True)
+    lazy.search_by_properties('b1')
+    lazy.extend([Word('budget', DATE, 'b1'),
+                 Word('get', DATE, 'c1', 'to receive')], on_conflict='replace')
+
+    assert len(lazy) == 4
+    assert lazy.data[0].english == ['to receive']
+    assert [word.word for word in lazy.search_by_properties('b1')] == \
+           ['forget', 'budget']
+    assert [word.word for word in Vocabulary(db_path, lazy=True)] == \
+           ['get', 'forget', 'target', 'budget']
+
+
+def test_lazy_vocabulary_replace_evicted(db_path):
+    lazy = Vocabulary(db_path, lazy=True)
+    # only the last page is cached
+    lazy.data._page_size, lazy.data._max_pages = 1, 1
+    lazy.search_by_properties('b1')
+    lazy[DATE]
+    lazy.extend([Word('get', DATE + datetime.timedelta(days=5), 'c1')],
+                on_conflict='replace')
+
+    assert [word.word for word in lazy.search_by_properties('b1')] == \
+           ['forget']
+    assert [word.word for word in lazy.search_by_properties('c1')] == ['get']
+    assert [word.word for word in lazy[DATE]] == ['forget']
+    assert [word.word for word in
+            lazy[DATE + datetime.timedelta(days=5)]] == ['get']
+
+
+def test_word_from_row():
+    word = Word('Get ', DATE, '[verb, B1]', 'to obtain; to buy', 'получать')
+    fields = word.fields
+    row = Word.from_row(
+        fields['id'], fields['word'], str(fields['date']),
+        fields['properties'], fields['English'], fields['Russian'])
+
+    assert repr(row) == repr(word)
+    assert (row.id, row.date) == (word.id, word.date)
+    assert repr(Word.from_row('', 'get', '2020-06-01 10:00:00', '', '', '')) \
+           == repr(Word('get'))
+
+
+def test_words_share_properties():
+    first = Word('get', DATE, 'B1, verb', ['to obtain', 'to buy; to pay'])
+    second = Word.from_row('', 'forget', '2020-06-01', '[b1, verb]', '', '')
+
+    assert first._properties is second._properties
+    assert first.english == ['to obtain', 'to buy; to pay']
+    assert first.fields['English'] == 'to obtain; to buy; to pay'
+    assert second.english == second.russian == []
+
+
+def test_words_memory():
+    rows = [
+        (f"{num:016x}", f"word number {num}", f"2020-06-{num % 28 + 1:02}",
+         '[b2, formal, noun]', 'the first definition; the second one',
+         'первое определение; второе')
+        for num in range(10_000)
+    ]
+
+    tracemalloc.start()
+    words = [Word.from_row(*row) for row in rows]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # it was more than 1000 bytes per word with lists of defs and properties
+    assert size / len(words) < 400
+
+
+def test_load_uses_stored_ids(db_path, monkeypatch):
+    ids = [word.id for word in Vocabulary(db_path)]
+
+    def word_id(item):
+        raise AssertionError("ID recalculated")
+
+    monkeypatch.setattr(comm_funcs, 'word_id', word_id)
+    monkeypatch.setattr(comm_funcs, '_word_id', word_id)
+    assert [word.id for word in Vocabulary(db_path)] == ids
+
+
+def test_word_ids():
+    items = ['get', 'forget', 'get', '']
+
+    assert comm_funcs.word_ids(items) == list(map(comm_funcs.word_id, items))
+
+
+def test_word_hash():
+    words = {Word('get', properties='b1'), Word('get ', properties='b1'),
+             Word('get', properties='c1'), Word('forget')}
+
+    assert len(words) == 3
+    assert Word('forget', DATE) in words
+    assert hash(Word('get')) == hash('get')
+    # equal, but the hash is consistent only with the stripped str
+    assert Word('get') == ' get ' and hash(Word('get')) != hash(' get ')
+    assert 'get' in {Word('get')} and ' get ' not in {Word('get')}
+
+
+def test_word_ordering():
+    get, forget = Word('get'), Word('forget')
+
+    assert forget < get and get > forget
+    assert forget <= get and get >= forget
+    assert get <= Word('get', properties='b1') <= get
+    assert get < 'target ' and not get > 'get'
+    assert sorted([get, Word('target'), forget]) == ['forget', 'get', 'target']
+    with pytest.raises(TypeError):
+        get < 1
+
+
+def test_all_words(vocabulary):
+    assert [word.word for word in vocabulary.all_words()] == \
+           ['forget', 'get', 'target']
+    assert [word.word for word in vocabulary.all_words(reverse=True)] == \
+           ['target', 'get', 'forget']
+
+
+def test_all_words_after_extend(vocabulary):
+    vocabulary.all_words()
+    vocabulary.extend([Word('budget'), Word('get', DATE, 'c1'),
+                       Word('widget'), Word('get', DATE, 'b2')],
+                      on_conflict='merge')
+    vocabulary.extend([Word('forget', DATE, 'c2')], on_conflict='replace')
+
+    for reverse in (False, True):
+        expected = sorted(vocabulary.data, key=Word.sort_key, reverse=reverse)
+        assert [repr(word) for word in vocabulary.all_words(reverse)] == \
+               [repr(word) for word in expected]
+
+
+def test_lazy_all_words_loads_rows_once(db_path, monkeypatch):
+    Vocabulary(db_path).extend(
+        [Word(f"word{number % 7}{number}", DATE) for number in range(40)])
+    expected = sorted(word.word for word in Vocabulary(db_path))
+    lazy = Vocabulary(db_path, lazy=True)
+    # the sorted positions jump over the small pages
+    lazy.data._page_size, lazy.data._max_pages = 2, 1
+    loaded, from_row = [], Word.from_row
+    monkeypatch.setattr(
+        Word, 'from_row', lambda *row: loaded.append(row) or from_row(*row))
+
+    assert [word.word for word in lazy.all_words()] == expected
+    # the index is built by the loaded words, every row is read once
+    assert len(loaded) == len(lazy)
+    assert [word.word for word in lazy.all_words(reverse=True)] == \
+           expected[::-1]
+    assert len(loaded) == 2 * len(lazy)
+
+
+def test_sorted_index_build(vocabulary):
+    vocabulary.extend([Word('budget'), Word('widget')])
+    built, added = indexes.SortedIndex(), indexes.SortedIndex()
+    built.build(vocabulary.data)
+    for position, word in enumerate(vocabulary.data):
+        added.add(position, word)
+
+    for reverse in (False, True):
+        assert list(built.positions(reverse)) == \
+               list(added.positions(reverse))
+
+
+def test_parse_malformed_row_releases_workbook(tmp_path, monkeypatch):
+    xlsxwriter = pytest.importorskip('xlsxwriter')
+    xlrd = pytest.importorskip('xlrd')
+    path = tmp_path / 'cambridge.xlsx'
+    book = xlsxwriter.Workbook(str(path))
+    sheet = book.add_worksheet()
+    # the table without the Russian defs
+    sheet.write_row(1, 0, ['Word', 'Properties', 'English'])
+    sheet.write_row(2, 0, ['get', 'verb', 'to obtain'])
+    book.close()
+    released = []
+    monkeypatch.setattr(xlrd.book.Book, 'release_resources',
+                        lambda self: released.append(self))
+
+    with pytest.raises(ValueError):
+        list(parse_cambridge_xlsx(path, DATE))
+    assert len(released) == 1
+
+
+def test_parse_cambridge_xlsx(tmp_path, db_path):
+    xlsxwriter = pytest.importorskip('xlsxwriter')
+    path = tmp_path / 'cambridge.xlsx'
+    rows = [
+        ['Word', 'Properties', 'English', 'Russian'],
+        ['get', 'B1, verb', 'to obtain', 'получать'],
+        ['forget', 'verb', 'to fail to remember', ''],
+        ['Get ', 'verb, b1', 'to buy', 'покупать'],
+        ['get', 'noun', 'offspring', 'потомство'],
+    ]
+    book = xlsxwriter.Workbook(str(path))
+    sheet = book.add_worksheet()
+    # the first row is empty
+    for num, row in enumerate(rows, 1):
+        sheet.write_row(num, 0, row)
+    book.close()
+
+    comm_funcs.word_id.cache_clear()
+    words = list(parse_cambridge_xlsx(path, DATE))
+
+    # the ids are counted bypassing the memo
+    assert comm_funcs.word_id.cache_info().currsize == 0
+    assert [word.id for word in words] == \
+           comm_funcs.word_ids(['get', 'forget', 'get'])
+    assert [repr(word) for word in words] == [
+        repr(Word('get', DATE, 'b1, verb', 'to obtain; to buy',
+                  'получать; покупать')),
+        repr(Word('forget', DATE, 'verb', 'to fail to remember')),
+        repr(Word('get', DATE, 'noun', 'offspring', 'потомство')),
+    ]
+    with pytest.raises(FileExistsError):
+        parse_cambridge_xlsx(tmp_path / 'wrong.xlsx')
+
+    with sqlite3.connect(db_path) as db:
+        db.execute("DELETE FROM Vocabulary WHERE word != 'target'")
+    vocabulary = Vocabulary(db_path)
+    # the senses of 'get' are merged to one row
+    vocabulary.extend(parse_cambridge_xlsx(path, DATE))
+
+    assert [word.word for word in Vocabulary(db_path)] == \
+           ['target', 'get', 'forget']
+    assert vocabulary.data[1].properties == ['b1', 'noun', 'verb']